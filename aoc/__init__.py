@@ -0,0 +1 @@
+"""Shared tooling for running and benchmarking the daily solutions"""
@@ -0,0 +1,93 @@
+"""Opt-in on-disk cache of the parsed inputs
+
+The result of `read_data` is pickled into `.cache/parsed/dayNN/` (ignored by
+git), under a key made of the SHA-256 of the input file and the parser
+version of the day. Editing the input file or bumping
+`DaySpec.parser_version` therefore makes the runner parse the file again,
+while repeated runs on the same input only unpickle the stored structure.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from typing import Any, Callable
+
+from aoc.registry import REPO_ROOT, DaySpec
+
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "parsed")
+
+
+def file_digest(filename: str) -> str:
+    sha = hashlib.sha256()
+
+    with open(filename, "rb") as fin:
+        for chunk in iter(lambda: fin.read(1 << 20), b""):
+            sha.update(chunk)
+
+    return sha.hexdigest()
+
+
+def cache_path(
+    spec: DaySpec,
+    filename: str,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+) -> str:
+    return os.path.join(
+        cache_dir,
+        spec.name,
+        f"{file_digest(filename)}-v{spec.parser_version}.pickle",
+    )
+
+
+def resolve_input_path(spec: DaySpec, filename: str) -> str:
+    """Where the input file of `filename` would be, independent of the cwd.
+
+    The registry lists real inputs with absolute paths, the bare names (e.g.,
+    `input.txt` of the hardcoded days) belong to the day's data directory.
+    """
+    if os.path.isabs(filename):
+        return filename
+
+    return os.path.join(REPO_ROOT, spec.name, "data", filename)
+
+
+def cached_read_data(
+    spec: DaySpec,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+) -> Callable[[str], Any]:
+    """Wraps `spec.read_data` so that every file is parsed only once."""
+
+    def read_data(filename: str) -> Any:
+        # Hardcoded inputs (days 17, 23 and 24) have no file to hash
+        input_path = resolve_input_path(spec, filename)
+        if not os.path.isfile(input_path):
+            return spec.read_data(filename)
+
+        path = cache_path(spec, input_path, cache_dir)
+
+        try:
+            with open(path, "rb") as fin:
+                return pickle.load(fin)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        data = spec.read_data(filename)
+
+        # Write to a temporary file first, so that parallel jobs reading the
+        # same input never see a partially written entry
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(tmp_path, "wb") as fout:
+            pickle.dump(data, fout, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, path)
+
+        return data
+
+    return read_data
+
+
+def with_cache(spec: DaySpec, cache_dir: str = DEFAULT_CACHE_DIR) -> DaySpec:
+    return spec._replace(read_data=cached_read_data(spec, cache_dir))
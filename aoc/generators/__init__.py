@@ -0,0 +1,80 @@
+"""Synthetic inputs of configurable size for stress-testing the solvers
+
+Every `dayNN` module exposes `generate(scale, rng)` that returns the contents
+of an input file in the exact format parsed by the corresponding
+`read_data`. A scale of `1` roughly matches the size of the puzzle input and
+the module docstrings describe what grows with the scale. Days 17, 23 and 24
+have hardcoded inputs, so there is nothing to generate for them.
+"""
+from __future__ import annotations
+
+import os
+import random
+from typing import Callable, Dict
+
+from aoc.generators import (
+    day01, day02, day03, day04, day05, day06, day07, day08, day09, day10,
+    day11, day12, day13, day14, day15, day16, day18, day19, day20, day21,
+    day22, day25,
+)
+from aoc.registry import REPO_ROOT
+
+DEFAULT_SEED = 2021
+
+GENERATORS: Dict[str, Callable[[int, random.Random], str]] = {
+    "day01": day01.generate,
+    "day02": day02.generate,
+    "day03": day03.generate,
+    "day04": day04.generate,
+    "day05": day05.generate,
+    "day06": day06.generate,
+    "day07": day07.generate,
+    "day08": day08.generate,
+    "day09": day09.generate,
+    "day10": day10.generate,
+    "day11": day11.generate,
+    "day12": day12.generate,
+    "day13": day13.generate,
+    "day14": day14.generate,
+    "day15": day15.generate,
+    "day16": day16.generate,
+    "day18": day18.generate,
+    "day19": day19.generate,
+    "day20": day20.generate,
+    "day21": day21.generate,
+    "day22": day22.generate,
+    "day25": day25.generate,
+}
+
+
+def generate(day: str, scale: int, seed: int = DEFAULT_SEED) -> str:
+    if day not in GENERATORS:
+        raise KeyError(f"No input generator for {day}")
+
+    if scale < 1:
+        raise ValueError(f"Scale must be a positive integer, got: {scale}")
+
+    # String seeds are hashed deterministically, so every (day, scale, seed)
+    # combination always yields the same file
+    rng = random.Random(f"{day}-{scale}-{seed}")
+
+    return GENERATORS[day](scale, rng)
+
+
+def generated_path(day: str, scale: int, seed: int = DEFAULT_SEED) -> str:
+    return os.path.join(
+        REPO_ROOT, day, "data", "generated", f"x{scale}-seed{seed}.txt",
+    )
+
+
+def ensure_generated(day: str, scale: int, seed: int = DEFAULT_SEED) -> str:
+    """Writes the input file unless it already exists and returns its path."""
+    path = generated_path(day, scale, seed)
+
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as fout:
+            fout.write(generate(day, scale, seed))
+
+    return path
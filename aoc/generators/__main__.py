@@ -0,0 +1,43 @@
+"""Writes synthetic inputs to `dayNN/data/generated/x<scale>-seed<seed>.txt`
+
+Usage (from the repository root):
+
+    python -m aoc.generators                      # all days, scales 10/100/1000
+    python -m aoc.generators 5 9 --scales 1 10    # selected days and scales
+"""
+import argparse
+import os
+import sys
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)
+    ))))
+
+from aoc.generators import DEFAULT_SEED, GENERATORS, ensure_generated
+from aoc.registry import normalize_day
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "days", nargs="*",
+        help="Days to generate inputs for (default: all supported days)",
+    )
+    parser.add_argument(
+        "--scales", nargs="+", type=int, default=[10, 100, 1_000],
+        help="Scale factors relative to the puzzle input size",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    days = [normalize_day(d) for d in args.days] or list(GENERATORS.keys())
+
+    for day in days:
+        for scale in args.scales:
+            path = ensure_generated(day, scale, seed=args.seed)
+            print(f"{day} x{scale}: {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""Day 1 - sonar depth readings (2000 readings per unit of scale)"""
+from __future__ import annotations
+
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    depth = rng.randint(100, 200)
+    depths = []
+
+    for _ in range(2_000 * scale):
+        # The sea floor slowly descends, with small bumps along the way
+        depth = max(0, depth + rng.randint(-8, 12))
+        depths.append(depth)
+
+    return "\n".join(str(d) for d in depths)
@@ -0,0 +1,26 @@
+"""Day 2 - submarine commands (1000 commands per unit of scale)"""
+from __future__ import annotations
+
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    commands = []
+    depth = 0
+
+    for _ in range(1_000 * scale):
+        name = rng.choice(("forward", "forward", "down", "up"))
+        value = rng.randint(1, 9)
+
+        # Never go above the surface
+        if name == "up" and depth - value < 0:
+            name = "down"
+
+        if name == "down":
+            depth += value
+        elif name == "up":
+            depth -= value
+
+        commands.append(f"{name} {value}")
+
+    return "\n".join(commands)
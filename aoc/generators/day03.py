@@ -0,0 +1,39 @@
+"""Day 3 - diagnostic report (1000 numbers per unit of scale)
+
+The rating filters of part two only terminate when every group of numbers
+sharing a prefix is split by the next bit, so the numbers are generated as
+a binary tree where each inner node has both children. The bit width grows
+with the number of entries (12 bits for the puzzle size).
+"""
+from __future__ import annotations
+
+import random
+from typing import List
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    num_entries = 1_000 * scale
+    num_bits = max(12, (2 * num_entries).bit_length())
+
+    numbers = _split(rng, prefix="", count=num_entries, num_bits=num_bits)
+    rng.shuffle(numbers)
+
+    return "\n".join(numbers)
+
+
+def _split(rng: random.Random, prefix: str, count: int, num_bits: int) -> List[str]:
+    remaining = num_bits - len(prefix)
+
+    if count == 1:
+        return [prefix + "".join(rng.choice("01") for _ in range(remaining))]
+
+    # Both halves must be non-empty and fit into the remaining bits
+    capacity = 2 ** (remaining - 1)
+    low = max(1, count - capacity)
+    high = min(count - 1, capacity)
+    num_ones = min(max(round(rng.gauss(count / 2, count / 8)), low), high)
+
+    return (
+        _split(rng, prefix + "0", count - num_ones, num_bits)
+        + _split(rng, prefix + "1", num_ones, num_bits)
+    )
@@ -0,0 +1,28 @@
+"""Day 4 - bingo draws and boards (100 boards per unit of scale)
+
+The board parser relies on the two-character wide columns of the puzzle, so
+all numbers stay below 100. Every number is drawn, hence every board wins.
+"""
+from __future__ import annotations
+
+import random
+
+BOARD_SIZE = 5
+MAX_NUMBER = 100
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    numbers = list(range(MAX_NUMBER))
+    rng.shuffle(numbers)
+
+    sections = [",".join(str(n) for n in numbers)]
+
+    for _ in range(100 * scale):
+        values = rng.sample(range(MAX_NUMBER), BOARD_SIZE * BOARD_SIZE)
+        rows = [
+            " ".join(f"{v:>2}" for v in values[i:i + BOARD_SIZE])
+            for i in range(0, len(values), BOARD_SIZE)
+        ]
+        sections.append("\n".join(rows))
+
+    return "\n\n".join(sections)
@@ -0,0 +1,55 @@
+"""Day 5 - hydrothermal vent lines (500 lines per unit of scale)
+
+The map side grows with the square root of the scale, so the density of
+overlapping points stays comparable to the puzzle input.
+"""
+from __future__ import annotations
+
+from math import isqrt
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    size = 1_000 * isqrt(scale * 100) // 10
+    lines = []
+
+    for _ in range(500 * scale):
+        kind = rng.choice(("horizontal", "vertical", "diagonal"))
+        length = rng.randint(1, size // 2)
+
+        x1 = rng.randrange(size)
+        y1 = rng.randrange(size)
+
+        if kind == "horizontal":
+            x2 = _clip(x1 + rng.choice((-1, 1)) * length, size)
+            y2 = y1
+            if x2 == x1:  # Clipped at the edge of the map
+                x2 = size - 1 - x1
+        elif kind == "vertical":
+            x2 = x1
+            y2 = _clip(y1 + rng.choice((-1, 1)) * length, size)
+            if y2 == y1:  # Clipped at the edge of the map
+                y2 = size - 1 - y1
+        else:
+            dx = rng.choice((-1, 1))
+            dy = rng.choice((-1, 1))
+            # Shorten the diagonal so that it fits on the map
+            length = min(
+                length,
+                x1 if dx < 0 else size - 1 - x1,
+                y1 if dy < 0 else size - 1 - y1,
+            )
+            if length == 0:  # Started at the edge, so turn inwards
+                dx = 1 if x1 < size // 2 else -1
+                dy = 1 if y1 < size // 2 else -1
+                length = 1
+            x2 = x1 + dx * length
+            y2 = y1 + dy * length
+
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+
+    return "\n".join(lines)
+
+
+def _clip(value: int, size: int) -> int:
+    return min(max(value, 0), size - 1)
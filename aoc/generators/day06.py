@@ -0,0 +1,8 @@
+"""Day 6 - lanternfish timers (300 fish per unit of scale)"""
+from __future__ import annotations
+
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(300 * scale))
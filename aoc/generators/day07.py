@@ -0,0 +1,17 @@
+"""Day 7 - crab positions (1000 crabs per unit of scale)
+
+The range of positions stays the same as in the puzzle input.
+"""
+from __future__ import annotations
+
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    # Most crabs are close to the origin, only a few are far away
+    positions = [
+        min(int(rng.expovariate(1 / 400)), 1_999)
+        for _ in range(1_000 * scale)
+    ]
+
+    return ",".join(str(p) for p in positions)
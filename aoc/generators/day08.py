@@ -0,0 +1,29 @@
+"""Day 8 - scrambled seven-segment displays (200 entries per unit of scale)"""
+from __future__ import annotations
+
+import random
+
+SEGMENTS = "abcdefg"
+DIGITS = (
+    "abcefg", "cf", "acdeg", "acdfg", "bcdf",
+    "abdfg", "abdefg", "acf", "abcdefg", "abcdfg",
+)
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    entries = []
+
+    for _ in range(200 * scale):
+        wiring = dict(zip(SEGMENTS, rng.sample(SEGMENTS, len(SEGMENTS))))
+
+        def scramble(digit: int) -> str:
+            wires = [wiring[segment] for segment in DIGITS[digit]]
+            rng.shuffle(wires)
+            return "".join(wires)
+
+        observed = [scramble(digit) for digit in rng.sample(range(10), 10)]
+        output = [scramble(rng.randrange(10)) for _ in range(4)]
+
+        entries.append(f"{' '.join(observed)} | {' '.join(output)}")
+
+    return "\n".join(entries)
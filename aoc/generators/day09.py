@@ -0,0 +1,59 @@
+"""Day 9 - height map (100x100 cells per unit of scale)
+
+Like in the puzzle input, the map is split into basins by walls of `9`s and
+each basin has exactly one low point.
+"""
+from __future__ import annotations
+
+from collections import deque
+from math import isqrt
+import random
+
+CELLS_PER_BASIN = 40
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    size = isqrt(100 * 100 * scale)
+
+    # Grow all basins at once from their low points (multi-source BFS)
+    num_basins = max(3, size * size // CELLS_PER_BASIN)
+    low_points = rng.sample(range(size * size), num_basins)
+
+    owner = [-1] * (size * size)
+    height = [0] * (size * size)
+    queue = deque()
+
+    for basin, cell in enumerate(low_points):
+        owner[cell] = basin
+        queue.append(cell)
+
+    while queue:
+        cell = queue.popleft()
+        row, col = divmod(cell, size)
+
+        for nrow, ncol in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if not (0 <= nrow < size and 0 <= ncol < size):
+                continue
+
+            neighbor = nrow * size + ncol
+            if owner[neighbor] == -1:
+                owner[neighbor] = owner[cell]
+                height[neighbor] = min(height[cell] + 1, 8)
+                queue.append(neighbor)
+
+    # Separate neighboring basins with walls
+    for cell in range(size * size):
+        row, col = divmod(cell, size)
+
+        for nrow, ncol in ((row + 1, col), (row, col + 1)):
+            if nrow < size and ncol < size:
+                neighbor = nrow * size + ncol
+                if owner[neighbor] < owner[cell] and height[cell] != 0:
+                    height[cell] = 9
+                elif owner[neighbor] > owner[cell] and height[neighbor] != 0:
+                    height[neighbor] = 9
+
+    return "\n".join(
+        "".join(str(h) for h in height[row * size:(row + 1) * size])
+        for row in range(size)
+    )
@@ -0,0 +1,38 @@
+"""Day 10 - navigation subsystem lines (100 lines per unit of scale)
+
+Roughly half of the lines are corrupted, the other half is incomplete.
+"""
+from __future__ import annotations
+
+import random
+
+PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+
+    for _ in range(100 * scale):
+        length = rng.randint(90, 110)
+        corrupt_at = rng.randrange(length) if rng.random() < 0.5 else None
+
+        chars = []
+        stack = []
+        for idx in range(length):
+            if idx == corrupt_at and stack:
+                expected = PAIRS[stack.pop()]
+                chars.append(rng.choice([c for c in PAIRS.values() if c != expected]))
+            elif stack and rng.random() < 0.45:
+                chars.append(PAIRS[stack.pop()])
+            else:
+                opening = rng.choice(list(PAIRS.keys()))
+                stack.append(opening)
+                chars.append(opening)
+
+        # Make sure that the line is not accidentally complete
+        if not stack and corrupt_at is None:
+            chars.append(rng.choice(list(PAIRS.keys())))
+
+        lines.append("".join(chars))
+
+    return "\n".join(lines)
@@ -0,0 +1,18 @@
+"""Day 11 - octopus energy levels
+
+Part two only ends once all octopuses flash at the same time, which is not
+guaranteed for larger random grids. Hence, the grid keeps the 10x10 size of
+the puzzle and the scale only changes the random values.
+"""
+from __future__ import annotations
+
+import random
+
+GRID_SIZE = 10
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "\n".join(
+        "".join(str(rng.randint(0, 9)) for _ in range(GRID_SIZE))
+        for _ in range(GRID_SIZE)
+    )
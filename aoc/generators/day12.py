@@ -0,0 +1,48 @@
+"""Day 12 - cave system
+
+The number of paths grows exponentially with the number of caves, so the
+scale adds caves logarithmically (the puzzle input has 6 small caves and
+3 big ones). Big caves are never connected with each other, otherwise there
+would be infinitely many paths.
+"""
+from __future__ import annotations
+
+import random
+import string
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    extra = scale.bit_length() - 1
+
+    names = rng.sample(
+        [a + b for a in string.ascii_lowercase for b in string.ascii_lowercase],
+        6 + extra + 3 + extra // 2,
+    )
+    small = names[:6 + extra]
+    big = [name.upper() for name in names[6 + extra:]]
+    caves = small + big
+
+    edges = set()
+
+    def connect(a: str, b: str):
+        if a != b and (b, a) not in edges and not (a in big and b in big):
+            edges.add((a, b))
+
+    # Guarantee that the start and the end are reachable
+    for cave in rng.sample(caves, 3):
+        connect("start", cave)
+    for cave in rng.sample(caves, 3):
+        connect(cave, "end")
+
+    # Big caves are the hubs that most paths go through
+    for cave in big:
+        for neighbor in rng.sample(small, 3):
+            connect(cave, neighbor)
+
+    for _ in range(len(caves)):
+        connect(rng.choice(small), rng.choice(caves))
+
+    edges = sorted(edges)
+    rng.shuffle(edges)
+
+    return "\n".join(f"{a}-{b}" for a, b in edges)
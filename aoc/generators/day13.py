@@ -0,0 +1,50 @@
+"""Day 13 - transparent paper dots (900 dots per unit of scale)
+
+The dots are generated on the final 40x6 sheet and then unfolded along
+the same fold lines as in the puzzle input.
+"""
+from __future__ import annotations
+
+import random
+
+FINAL_WIDTH = 40
+FINAL_HEIGHT = 6
+FOLDS = ("x", "y", "x", "y", "x", "y", "x", "y", "x", "y", "y", "y")
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    # Compute the fold lines backwards from the final sheet size
+    width, height = FINAL_WIDTH, FINAL_HEIGHT
+    fold_lines = []
+    for axis in reversed(FOLDS):
+        if axis == "x":
+            fold_lines.append((axis, width))
+            width = 2 * width + 1
+        else:
+            fold_lines.append((axis, height))
+            height = 2 * height + 1
+    fold_lines.reverse()
+
+    # Only some of the cells are lit on the final sheet (the "letters")
+    lit_cells = rng.sample(
+        [(x, y) for x in range(FINAL_WIDTH) for y in range(FINAL_HEIGHT)],
+        FINAL_WIDTH * FINAL_HEIGHT // 2,
+    )
+
+    dots = []
+    for _ in range(900 * scale):
+        x, y = rng.choice(lit_cells)
+
+        # Randomly mirror the dot while unfolding the sheet
+        for axis, value in reversed(fold_lines):
+            if rng.random() < 0.5:
+                if axis == "x":
+                    x = 2 * value - x
+                else:
+                    y = 2 * value - y
+
+        dots.append(f"{x},{y}")
+
+    instructions = [f"fold along {axis}={value}" for axis, value in fold_lines]
+
+    return "\n".join(dots) + "\n\n" + "\n".join(instructions)
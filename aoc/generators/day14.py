@@ -0,0 +1,19 @@
+"""Day 14 - polymer template (20 atoms per unit of scale) and insertion rules"""
+from __future__ import annotations
+
+import random
+
+ATOMS = "BCFHKNOPSV"
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    template = "".join(rng.choice(ATOMS) for _ in range(20 * scale))
+
+    rules = [
+        f"{left}{right} -> {rng.choice(ATOMS)}"
+        for left in ATOMS
+        for right in ATOMS
+    ]
+    rng.shuffle(rules)
+
+    return template + "\n\n" + "\n".join(rules)
@@ -0,0 +1,20 @@
+"""Day 15 - risk level map (100x100 cells per unit of scale)"""
+from __future__ import annotations
+
+from math import isqrt
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    size = isqrt(100 * 100 * scale)
+
+    # Low risk levels dominate, just like in the puzzle input
+    weights = (30, 15, 12, 10, 8, 7, 6, 6, 6)
+
+    return "\n".join(
+        "".join(
+            str(risk)
+            for risk in rng.choices(range(1, 10), weights=weights, k=size)
+        )
+        for _ in range(size)
+    )
@@ -0,0 +1,81 @@
+"""Day 16 - BITS transmission (about 1300 hex digits per unit of scale)
+
+A random packet hierarchy is built top-down and encoded as binary, with both
+length types used for the operator packets.
+"""
+from __future__ import annotations
+
+import random
+
+LITERAL_TYPE_ID = 4
+COMPARISON_TYPE_IDS = (5, 6, 7)
+VARIADIC_TYPE_IDS = (0, 1, 2, 3)
+
+# The number of sub-packets must fit into an 11-bit field and their total
+# length into a 15-bit field
+MAX_SUB_PACKETS = 2 ** 11 - 1
+MAX_BITS_FOR_LENGTH_TYPE_0 = 2 ** 15 - 1
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    # The top-level packet is a sum of independent expressions, nested into
+    # further sums when there are too many of them for a single packet
+    packets = [_expression(rng, depth=0) for _ in range(12 * scale)]
+
+    while len(packets) > 1:
+        packets = [
+            _operator(rng, type_id=0, children=packets[i:i + MAX_SUB_PACKETS])
+            for i in range(0, len(packets), MAX_SUB_PACKETS)
+        ]
+
+    bits = packets[0]
+
+    bits += "0" * (-len(bits) % 4)
+
+    return "".join(
+        f"{int(bits[i:i + 4], 2):X}"
+        for i in range(0, len(bits), 4)
+    )
+
+
+def _expression(rng: random.Random, depth: int) -> str:
+    if depth >= 4 or rng.random() < 0.3:
+        return _literal(rng, value=rng.randrange(2 ** rng.randint(4, 40)))
+
+    if rng.random() < 0.25:
+        type_id = rng.choice(COMPARISON_TYPE_IDS)
+        num_children = 2
+    else:
+        type_id = rng.choice(VARIADIC_TYPE_IDS)
+        num_children = rng.randint(1, 4)
+
+    children = [_expression(rng, depth + 1) for _ in range(num_children)]
+    return _operator(rng, type_id=type_id, children=children)
+
+
+def _header(rng: random.Random, type_id: int) -> str:
+    return f"{rng.randrange(8):03b}{type_id:03b}"
+
+
+def _literal(rng: random.Random, value: int) -> str:
+    value_bits = f"{value:b}"
+    value_bits = "0" * (-len(value_bits) % 4) + value_bits
+
+    groups = [value_bits[i:i + 4] for i in range(0, len(value_bits), 4)]
+    payload = "".join(
+        ("0" if idx == len(groups) - 1 else "1") + group
+        for idx, group in enumerate(groups)
+    )
+
+    return _header(rng, LITERAL_TYPE_ID) + payload
+
+
+def _operator(rng: random.Random, type_id: int, children: list) -> str:
+    payload = "".join(children)
+
+    if len(payload) <= MAX_BITS_FOR_LENGTH_TYPE_0 and rng.random() < 0.5:
+        length = "0" + f"{len(payload):015b}"
+    else:
+        length = "1" + f"{len(children):011b}"
+
+    return _header(rng, type_id) + length + payload
@@ -0,0 +1,25 @@
+"""Day 18 - snailfish numbers (100 numbers per unit of scale)
+
+All numbers are already reduced: pairs are nested at most four levels deep
+and every regular number is a single digit.
+"""
+from __future__ import annotations
+
+import random
+
+MAX_DEPTH = 4
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "\n".join(_pair(rng, depth=1) for _ in range(100 * scale))
+
+
+def _element(rng: random.Random, depth: int) -> str:
+    if depth < MAX_DEPTH and rng.random() < 0.6:
+        return _pair(rng, depth + 1)
+
+    return str(rng.randint(0, 9))
+
+
+def _pair(rng: random.Random, depth: int) -> str:
+    return f"[{_element(rng, depth)},{_element(rng, depth)}]"
@@ -0,0 +1,105 @@
+"""Day 19 - beacon scanner reports (30 scanners per unit of scale)
+
+Scanners are placed along a random walk, so that each one overlaps with its
+predecessor. Enough beacons are put into every overlap to make the two
+reports alignable (at least 12 shared beacons). Each report is rotated by a
+random one of the 24 orientations.
+"""
+from __future__ import annotations
+
+from itertools import permutations, product
+import random
+from typing import List, Tuple
+
+Point = Tuple[int, int, int]
+
+SCANNER_RANGE = 1_000
+SHARED_BEACONS = 12
+OWN_BEACONS = 4
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    rotations = _rotations()
+
+    scanners = [(0, 0, 0)]
+    beacons = set()
+    direction = [rng.choice((-1, 1)) for _ in range(3)]
+
+    while len(scanners) < 30 * scale:
+        previous = scanners[-1]
+
+        # Large steps that rarely turn back keep the overlaps with more
+        # distant scanners small
+        direction = [-d if rng.random() < 0.2 else d for d in direction]
+        scanner = tuple(
+            p + d * rng.randint(SCANNER_RANGE // 2, SCANNER_RANGE)
+            for p, d in zip(previous, direction)
+        )
+
+        # Beacons visible from both the previous and the new scanner
+        low = [max(a, b) - SCANNER_RANGE for a, b in zip(previous, scanner)]
+        high = [min(a, b) + SCANNER_RANGE for a, b in zip(previous, scanner)]
+        for _ in range(SHARED_BEACONS):
+            beacons.add(tuple(rng.randint(lo, hi) for lo, hi in zip(low, high)))
+
+        scanners.append(scanner)
+
+    for scanner in scanners:
+        for _ in range(OWN_BEACONS):
+            beacons.add(tuple(
+                rng.randint(p - SCANNER_RANGE, p + SCANNER_RANGE)
+                for p in scanner
+            ))
+
+    reports = []
+    for idx, scanner in enumerate(scanners):
+        rotation = rng.choice(rotations)
+        visible = [
+            _rotate(rotation, _diff(beacon, scanner))
+            for beacon in beacons
+            if all(abs(b - s) <= SCANNER_RANGE for b, s in zip(beacon, scanner))
+        ]
+        rng.shuffle(visible)
+
+        lines = [f"--- scanner {idx} ---"]
+        lines.extend(",".join(str(v) for v in point) for point in visible)
+        reports.append("\n".join(lines))
+
+    return "\n\n".join(reports)
+
+
+def _rotations() -> List[List[List[int]]]:
+    """All signed permutation matrices with a determinant of 1."""
+    out = []
+
+    for perm in permutations(range(3)):
+        for signs in product((1, -1), repeat=3):
+            matrix = [[0] * 3 for _ in range(3)]
+            for row, (col, sign) in enumerate(zip(perm, signs)):
+                matrix[row][col] = sign
+
+            if _det(matrix) == 1:
+                out.append(matrix)
+
+    assert len(out) == 24
+    return out
+
+
+def _det(m: List[List[int]]) -> int:
+    return (
+        m[0][0] * (m[1][1] * m[2][2] - m[1][2] * m[2][1])
+        - m[0][1] * (m[1][0] * m[2][2] - m[1][2] * m[2][0])
+        + m[0][2] * (m[1][0] * m[2][1] - m[1][1] * m[2][0])
+    )
+
+
+def _diff(a: Point, b: Point) -> Point:
+    return a[0] - b[0], a[1] - b[1], a[2] - b[2]
+
+
+def _rotate(m: List[List[int]], v: Point) -> Point:
+    return (
+        m[0][0] * v[0] + m[0][1] * v[1] + m[0][2] * v[2],
+        m[1][0] * v[0] + m[1][1] * v[1] + m[1][2] * v[2],
+        m[2][0] * v[0] + m[2][1] * v[1] + m[2][2] * v[2],
+    )
@@ -0,0 +1,21 @@
+"""Day 20 - image enhancement (100x100 pixel image per unit of scale)
+
+Like in the puzzle input, the enhancement algorithm lights up the infinite
+background on odd steps and darkens it again on even steps.
+"""
+from __future__ import annotations
+
+from math import isqrt
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    size = isqrt(100 * 100 * scale)
+
+    lookup = ["#"] + [rng.choice(".#") for _ in range(510)] + ["."]
+    image = [
+        "".join(rng.choice(".#") for _ in range(size))
+        for _ in range(size)
+    ]
+
+    return "".join(lookup) + "\n\n" + "\n".join(image)
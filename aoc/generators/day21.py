@@ -0,0 +1,14 @@
+"""Day 21 - starting positions
+
+The input is just the two starting positions, so there is nothing to scale.
+"""
+from __future__ import annotations
+
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return (
+        f"Player 1 starting position: {rng.randint(1, 10)}\n"
+        f"Player 2 starting position: {rng.randint(1, 10)}"
+    )
@@ -0,0 +1,41 @@
+"""Day 22 - reactor reboot steps (420 steps per unit of scale)
+
+The first 20 steps per unit of scale lie within the initialization region
+(-50..50 on every axis), the rest span the whole reactor.
+"""
+from __future__ import annotations
+
+import random
+from typing import Tuple
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    steps = []
+
+    for idx in range(420 * scale):
+        if idx < 20 * scale:
+            ranges = [_range(rng, -50, 50, min_len=10, max_len=50) for _ in range(3)]
+            mode = "off" if idx % 10 >= 7 else "on"
+        else:
+            ranges = [
+                _range(rng, -100_000, 100_000, min_len=2_000, max_len=40_000)
+                for _ in range(3)
+            ]
+            mode = rng.choice(("on", "off"))
+
+        (x1, x2), (y1, y2), (z1, z2) = ranges
+        steps.append(f"{mode} x={x1}..{x2},y={y1}..{y2},z={z1}..{z2}")
+
+    return "\n".join(steps)
+
+
+def _range(
+    rng: random.Random,
+    low: int,
+    high: int,
+    min_len: int,
+    max_len: int,
+) -> Tuple[int, int]:
+    length = rng.randint(min_len, max_len)
+    start = rng.randint(low, high - length)
+    return start, start + length
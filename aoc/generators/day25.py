@@ -0,0 +1,19 @@
+"""Day 25 - sea cucumber herds (139x137 cells per unit of scale)
+
+About a quarter of the cells hold an east-facing and another quarter a
+south-facing sea cucumber, like in the puzzle input.
+"""
+from __future__ import annotations
+
+from math import isqrt
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    width = isqrt(139 * 139 * scale)
+    height = isqrt(137 * 137 * scale)
+
+    return "\n".join(
+        "".join(rng.choices(".>v", weights=(2, 1, 1), k=width))
+        for _ in range(height)
+    )
@@ -0,0 +1,239 @@
+"""Compact 2D grid shared by the grid-based days
+
+The cells are stored row-major in a single `bytearray`, so every cell is
+addressed by a flat index `idx = row * width + col` and holds a small
+integer (0-255). Neighbors are looked up in tables that are computed once
+per grid shape, instead of allocating a list of `(row, col)` tuples for every
+visited cell.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (row delta, column delta)
+OFFSETS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+OFFSETS_8 = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 1),
+    (1, -1), (1, 0), (1, 1),
+)
+
+OUTSIDE = -1
+
+DIGITS = {str(digit): digit for digit in range(10)}
+
+
+def make_translation_table(mapping: Dict[str, int]) -> Tuple[bytes, bytes]:
+    """`bytes.translate` table of the mapping and the bytes it knows."""
+    table = bytearray(256)
+
+    for char, value in mapping.items():
+        table[ord(char)] = value
+
+    return bytes(table), "".join(mapping).encode()
+
+
+class Grid:
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: Optional[bytearray] = None,
+        wrap: bool = False,
+    ):
+        if cells is None:
+            cells = bytearray(width * height)
+
+        assert len(cells) == width * height
+
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.wrap = wrap
+
+        # Shared between copies, as they only depend on the shape
+        self._tables: Dict[Tuple, list] = {}
+
+    @staticmethod
+    def from_lines(
+        lines: Iterable[str],
+        mapping: Optional[Dict[str, int]] = None,
+        wrap: bool = False,
+    ) -> Grid:
+        """Parses rows of characters, by default digits to their values.
+
+        Every row is translated at C speed with a 256-byte table, characters
+        missing from the mapping raise a `KeyError`.
+        """
+        table, known = make_translation_table(
+            DIGITS if mapping is None else mapping
+        )
+
+        cells = bytearray()
+        width = None
+        height = 0
+
+        for line in lines:
+            row = line.strip().encode()
+            if not row:
+                continue
+
+            unknown = row.translate(None, known)
+            if unknown:
+                raise KeyError(unknown[:1].decode(errors="replace"))
+
+            cells += row.translate(table)
+
+            width = len(row)
+            height += 1
+
+        return Grid(width=width, height=height, cells=cells, wrap=wrap)
+
+    @staticmethod
+    def from_rows(rows: List[List[int]], wrap: bool = False) -> Grid:
+        return Grid(
+            width=len(rows[0]),
+            height=len(rows),
+            cells=bytearray(v for row in rows for v in row),
+            wrap=wrap,
+        )
+
+    @property
+    def size(self) -> int:
+        return self.width * self.height
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.width + col
+
+    def position(self, idx: int) -> Tuple[int, int]:
+        return divmod(idx, self.width)
+
+    def __getitem__(self, key: Tuple[int, int]) -> int:
+        row, col = key
+        return self.cells[row * self.width + col]
+
+    def __setitem__(self, key: Tuple[int, int], value: int):
+        row, col = key
+        self.cells[row * self.width + col] = value
+
+    def __eq__(self, other: Grid) -> bool:
+        if not isinstance(other, Grid):
+            return False
+
+        return (
+            self.width == other.width
+            and self.height == other.height
+            and self.cells == other.cells
+        )
+
+    def __repr__(self):
+        return "\n".join(
+            "".join(str(v) for v in self.row(r))
+            for r in range(self.height)
+        )
+
+    def copy(self) -> Grid:
+        grid = Grid(self.width, self.height, bytearray(self.cells), self.wrap)
+        grid._tables = self._tables
+        return grid
+
+    def row(self, row: int) -> bytearray:
+        return self.cells[row * self.width:(row + 1) * self.width]
+
+    def rows(self) -> List[bytearray]:
+        return [self.row(r) for r in range(self.height)]
+
+    def count(self, value: int) -> int:
+        return self.cells.count(value)
+
+    def to_lines(self, mapping: Dict[int, str]) -> List[str]:
+        return [
+            "".join(mapping[v] for v in self.row(r))
+            for r in range(self.height)
+        ]
+
+    def padded(self, delta: int, value: int) -> Grid:
+        """A larger grid with a border of `delta` cells of the given value."""
+        width = self.width + 2 * delta
+        border_rows = bytes([value]) * (width * delta)
+        side = bytes([value]) * delta
+
+        cells = bytearray(border_rows)
+        for r in range(self.height):
+            cells += side
+            cells += self.row(r)
+            cells += side
+        cells += border_rows
+
+        return Grid(width, self.height + 2 * delta, cells, self.wrap)
+
+    def offset_table(self, drow: int, dcol: int) -> List[int]:
+        """Index of the cell at `(row + drow, col + dcol)` for every cell.
+
+        Cells that would fall off the grid are mapped to `OUTSIDE`, unless the
+        grid wraps around.
+        """
+        key = ("offset", drow, dcol)
+
+        if key not in self._tables:
+            table = [
+                self._shift(row, col, drow, dcol)
+                for row in range(self.height)
+                for col in range(self.width)
+            ]
+
+            self._tables[key] = table
+
+        return self._tables[key]
+
+    def neighbors4(self) -> List[Tuple[int, ...]]:
+        """Indices of the (up to) 4 orthogonal neighbors of every cell."""
+        return self._neighbor_table(OFFSETS_4)
+
+    def neighbors8(self) -> List[Tuple[int, ...]]:
+        """Indices of the (up to) 8 neighbors, diagonals included."""
+        return self._neighbor_table(OFFSETS_8)
+
+    def _neighbor_table(self, offsets: Tuple) -> List[Tuple[int, ...]]:
+        key = ("neighbors", offsets)
+
+        if key not in self._tables:
+            width, height = self.width, self.height
+            deltas = [dr * width + dc for dr, dc in offsets]
+            table = []
+
+            for row in range(height):
+                is_inner_row = 0 < row < height - 1
+
+                for col in range(width):
+                    idx = row * width + col
+
+                    if is_inner_row and 0 < col < width - 1 and not self.wrap:
+                        # All neighbors exist, so plain index arithmetic works
+                        table.append(tuple(map(idx.__add__, deltas)))
+                    else:
+                        table.append(tuple(
+                            n
+                            for n in (
+                                self._shift(row, col, dr, dc)
+                                for dr, dc in offsets
+                            )
+                            if n != OUTSIDE
+                        ))
+
+            self._tables[key] = table
+
+        return self._tables[key]
+
+    def _shift(self, row: int, col: int, drow: int, dcol: int) -> int:
+        nrow, ncol = row + drow, col + dcol
+
+        if self.wrap:
+            nrow %= self.height
+            ncol %= self.width
+
+        if 0 <= nrow < self.height and 0 <= ncol < self.width:
+            return nrow * self.width + ncol
+
+        return OUTSIDE
@@ -0,0 +1,180 @@
+"""Memoization scoped to a single call tree
+
+A replacement for a module-level `functools.lru_cache` on the recursive
+solvers. The cache only lives as long as the outermost call (or an explicit
+`scope()`), so solving many inputs in one process doesn't keep the results
+of all previous ones. The cache can also be bounded (least recently used
+entries are evicted first) and every memoized function counts its hits,
+misses and the peak cache size, which the runner reports per phase.
+
+    @memoize
+    def count_paths(node: str) -> int: ...
+
+    with count_paths.scope():  # share the cache between several calls
+        total = sum(count_paths(n) for n in nodes)
+
+Each scope is backed by a fresh `lru_cache` of the function, so the lookups
+themselves still run at C speed. Inside a scope, the function's recursive
+calls by its own (global) name go straight to that `lru_cache` object, so a
+level of recursion costs a single Python frame, just like with a plain
+`lru_cache`. The statistics and the scoping only run on the outermost call.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import lru_cache, update_wrapper
+import threading
+from types import FunctionType
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+
+class MemoStats(NamedTuple):
+    hits: int
+    misses: int
+    peak_size: int
+    maxsize: Optional[int]
+
+
+class _Scope(threading.local):
+    # The class attribute is the default in every thread
+    cached: Optional[Callable[..., Any]] = None
+
+
+class Memoized:
+    """Scopes and statistics of a memoized function (see `memoize`)."""
+
+    def __init__(self, function: Callable[..., Any], maxsize: Optional[int]):
+        self.function = function
+        self.maxsize = maxsize
+        self.name = f"{function.__module__}.{function.__qualname__}"
+
+        self.local = _Scope()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.peak_size = 0
+
+    def stats(self) -> MemoStats:
+        return MemoStats(
+            hits=self.hits,
+            misses=self.misses,
+            peak_size=self.peak_size,
+            maxsize=self.maxsize,
+        )
+
+    @staticmethod
+    def _rebind(function: Callable[..., Any]) -> Callable[..., Any]:
+        """A copy of `function` with its own copy of the module globals.
+
+        The name of the function can then be pointed at the cache of a single
+        scope without touching the module, which other threads (and scopes)
+        still see. Assignments to module globals from inside the function
+        would only change the copy.
+        """
+        rebound = FunctionType(
+            function.__code__,
+            dict(function.__globals__),
+            function.__name__,
+            function.__defaults__,
+            function.__closure__,
+        )
+        rebound.__kwdefaults__ = function.__kwdefaults__
+        return update_wrapper(rebound, function)
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Shares one cache between all calls made inside the block.
+
+        Nested scopes reuse the cache of the outermost one.
+        """
+        if self.local.cached is not None:
+            yield
+            return
+
+        rebound = self._rebind(self.function)
+        cached = lru_cache(maxsize=self.maxsize)(rebound)
+        rebound.__globals__[self.function.__name__] = cached
+        self.local.cached = cached
+
+        try:
+            yield
+        finally:
+            self.local.cached = None
+
+            # Entries are only evicted from a full cache, so the final size
+            # is also the peak one
+            info = cached.cache_info()
+            self.hits += info.hits
+            self.misses += info.misses
+            self.peak_size = max(self.peak_size, info.currsize)
+
+
+# All memoized functions, so that their statistics can be collected
+_MEMOIZED: List[Memoized] = []
+
+
+def memoize(
+    function: Optional[Callable[..., Any]] = None,
+    *,
+    maxsize: Optional[int] = None,
+) -> Any:
+    """Decorator, usable as `@memoize` or `@memoize(maxsize=...)`.
+
+    The wrapped function gets a `scope()` context manager and a `stats()`
+    method, the `Memoized` object itself is available as `memo`.
+
+    Only module-level functions can be memoized. To keep the recursion at a
+    single frame per level, a scope runs the function with a snapshot of its
+    module globals (in which its own name is the scope's cache). While a
+    scope is open, the function doesn't see later changes of the module
+    globals (e.g., monkeypatching or reassigned constants), and its `global`
+    assignments only change the snapshot.
+    """
+
+    def decorate(f: Callable[..., Any]) -> Callable[..., Any]:
+        # The recursive calls of nested functions don't go through the
+        # module globals, so the rebinding would silently do nothing
+        assert f.__qualname__ == f.__name__, (
+            f"Only module-level functions can be memoized, got {f.__qualname__}"
+        )
+
+        memo = Memoized(f, maxsize=maxsize)
+        local = memo.local
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cached = local.cached
+
+            if cached is None:  # Outermost call, starts its own scope
+                with memo.scope():
+                    return local.cached(*args, **kwargs)
+
+            return cached(*args, **kwargs)
+
+        update_wrapper(wrapper, f)
+        wrapper.memo = memo
+        wrapper.scope = memo.scope
+        wrapper.stats = memo.stats
+
+        _MEMOIZED.append(memo)
+        return wrapper
+
+    if function is not None:
+        return decorate(function)
+
+    return decorate
+
+
+def reset_memo_stats():
+    for memo in _MEMOIZED:
+        memo.reset_stats()
+
+
+def memo_stats() -> Dict[str, MemoStats]:
+    """Statistics of the functions called since the last reset."""
+    return {
+        memo.name: memo.stats()
+        for memo in _MEMOIZED
+        if memo.hits or memo.misses
+    }
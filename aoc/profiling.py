@@ -0,0 +1,100 @@
+"""cProfile hooks for the runner
+
+Every profiled call produces two files:
+
+* `<name>.pstats` - raw `cProfile` statistics, e.g. for `snakeviz` or
+  `python -m pstats`,
+* `<name>.collapsed` - "collapsed stacks" (`outer;inner;leaf <microseconds>`
+  per line), the input format of `flamegraph.pl` and speedscope.
+
+`cProfile` only records caller/callee pairs, not full stacks, so the
+collapsed stacks are rebuilt from the call graph: the time of a function
+is split between its callers proportionally to the time spent in each of
+the calls. This is exact for trees and a good approximation otherwise.
+"""
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+from typing import Any, Callable, Dict, List, Tuple
+
+FunctionKey = Tuple[str, int, str]  # (file, line, function name)
+
+
+def profile_call(
+    function: Callable[..., Any],
+    *args: Any,
+    output_prefix: str,
+) -> Any:
+    """Calls `function(*args)` under `cProfile` and writes both profiles."""
+    profiler = cProfile.Profile()
+
+    try:
+        return profiler.runcall(function, *args)
+    finally:
+        os.makedirs(os.path.dirname(os.path.abspath(output_prefix)), exist_ok=True)
+
+        # Written to temporary files first, so that concurrent runs with the
+        # same prefix can't leave a mix of both profiles behind
+        suffix = f".{os.getpid()}.tmp"
+
+        profiler.dump_stats(f"{output_prefix}.pstats{suffix}")
+
+        with open(f"{output_prefix}.collapsed{suffix}", "w") as fout:
+            for line in collapse_stacks(pstats.Stats(profiler)):
+                fout.write(f"{line}\n")
+
+        for extension in ("pstats", "collapsed"):
+            os.replace(
+                f"{output_prefix}.{extension}{suffix}",
+                f"{output_prefix}.{extension}",
+            )
+
+
+def _label(func: FunctionKey) -> str:
+    filename, line, name = func
+
+    if filename == "~":  # Built-ins, e.g. `<built-in method builtins.min>`
+        return name
+
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapse_stacks(stats: pstats.Stats) -> List[str]:
+    raw: Dict[FunctionKey, tuple] = stats.stats  # type: ignore[attr-defined]
+
+    callees: Dict[FunctionKey, Dict[FunctionKey, float]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            callees.setdefault(caller, {})[func] = cumulative_time
+
+    # Functions without a (profiled) caller start the stacks
+    roots = [func for func, entry in raw.items() if not entry[4]]
+
+    samples: Dict[str, float] = {}
+
+    def visit(func: FunctionKey, path: List[FunctionKey], share: float):
+        _, _, own_time, cumulative_time, _ = raw[func]
+        stack = ";".join(_label(f) for f in path)
+        samples[stack] = samples.get(stack, 0.0) + own_time * share
+
+        for callee, edge_time in callees.get(func, {}).items():
+            if callee in path:  # Recursion is folded into the first frame
+                continue
+
+            callee_cumulative = raw[callee][3]
+            if callee_cumulative <= 0 or cumulative_time <= 0:
+                continue
+
+            callee_share = edge_time * share / callee_cumulative
+            visit(callee, path + [callee], callee_share)
+
+    for root in roots:
+        visit(root, [root], 1.0)
+
+    return [
+        f"{stack} {round(seconds * 1e6)}"
+        for stack, seconds in sorted(samples.items())
+        if round(seconds * 1e6) > 0
+    ]
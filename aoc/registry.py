@@ -0,0 +1,205 @@
+"""Uniform access to the `dayNN` solvers
+
+Each day exposes a slightly different interface (`solve` instead of separate
+parts, hardcoded inputs, extra arguments), so the special cases are collected
+here and every day is described by the same `DaySpec`.
+"""
+from __future__ import annotations
+
+from functools import partial
+import glob
+import importlib
+import os
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NamedTuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+ALL_DAYS = [f"day{idx:02d}" for idx in range(1, 26)]
+
+
+class Phase(NamedTuple):
+    name: str
+    function: Callable[[Any], Any]
+
+
+class DaySpec(NamedTuple):
+    name: str
+    files: List[str]
+    read_data: Callable[[str], Any]
+    phases: List[Phase]
+    # Part of the parsed-input cache key (see `aoc.cache`), bump it whenever
+    # `read_data` starts returning something different for the same file (in
+    # the day's `PARSER_VERSION` for the days without a special case)
+    parser_version: int = 1
+
+    def get_phase(self, name: str) -> Phase:
+        for phase in self.phases:
+            if phase.name == name:
+                return phase
+
+        raise KeyError(f"Unknown phase '{name}' for {self.name}")
+
+
+def import_solver(day: str, module: str = "main") -> ModuleType:
+    return importlib.import_module(f"{day}.{module}")
+
+
+def data_files(day: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(REPO_ROOT, day, "data", "*.txt")))
+
+
+def _default_spec(day: str) -> DaySpec:
+    module = import_solver(day)
+
+    return DaySpec(
+        name=day,
+        files=data_files(day),
+        read_data=module.read_data,
+        phases=[
+            Phase("part_one", module.solve_part_one),
+            Phase("part_two", module.solve_part_two),
+        ],
+        parser_version=getattr(module, "PARSER_VERSION", 1),
+    )
+
+
+def _day06_spec() -> DaySpec:
+    module = import_solver("day06")
+
+    return DaySpec(
+        name="day06",
+        files=data_files("day06"),
+        read_data=module.read_data,
+        phases=[
+            Phase("part_one", partial(module.simulate_fish_naive, num_days=80)),
+            Phase("part_two", partial(
+                module.simulate_fish_with_matrix_power, num_days=256,
+            )),
+        ],
+    )
+
+
+def _day07_spec() -> DaySpec:
+    module = import_solver("day07")
+
+    return DaySpec(
+        name="day07",
+        files=data_files("day07"),
+        read_data=module.read_data,
+        phases=[
+            Phase("part_one", module.solve_part_one_using_median),
+            Phase("part_two", module.solve_part_two),
+        ],
+    )
+
+
+def _day14_spec() -> DaySpec:
+    module = import_solver("day14")
+
+    return DaySpec(
+        name="day14",
+        files=data_files("day14"),
+        read_data=module.read_data,
+        phases=[
+            Phase("part_one", partial(module.solve, num_steps=10)),
+            Phase("part_two", partial(module.solve, num_steps=40)),
+        ],
+    )
+
+
+def _day17_spec() -> DaySpec:
+    module = import_solver("day17")
+
+    return DaySpec(
+        name="day17",
+        files=list(module.CASES.keys()),
+        read_data=lambda name: module.CASES[name],
+        phases=[Phase("solve", module.solve)],
+    )
+
+
+def _day19_spec() -> DaySpec:
+    module = import_solver("day19")
+
+    return DaySpec(
+        name="day19",
+        files=data_files("day19"),
+        read_data=module.read_data,
+        phases=[Phase("solve", module.solve)],
+    )
+
+
+def _day23_spec() -> DaySpec:
+    module = import_solver("day23")
+
+    # The puzzle inputs are hardcoded and looked up by the bare file name
+    return DaySpec(
+        name="day23",
+        files=["example.txt", "input.txt"],
+        read_data=lambda filename: module.read_data(os.path.basename(filename)),
+        phases=[
+            Phase("part_one", module.solve_part_one),
+            Phase("part_two", module.solve_part_two),
+        ],
+    )
+
+
+def _day24_spec() -> DaySpec:
+    module = import_solver("day24")
+
+    # The solution was derived by hand, there is no input to read
+    return DaySpec(
+        name="day24",
+        files=["input"],
+        read_data=lambda _: None,
+        phases=[
+            Phase("part_one", lambda _: module.solve_part_one()),
+            Phase("part_two", lambda _: module.solve_part_two()),
+        ],
+    )
+
+
+def _day25_spec() -> DaySpec:
+    module = import_solver("day25")
+
+    return DaySpec(
+        name="day25",
+        files=data_files("day25"),
+        read_data=module.read_data,
+        phases=[Phase("part_one", module.solve_part_one)],
+    )
+
+
+SPECIAL_CASES: Dict[str, Callable[[], DaySpec]] = {
+    "day06": _day06_spec,
+    "day07": _day07_spec,
+    "day14": _day14_spec,
+    "day17": _day17_spec,
+    "day19": _day19_spec,
+    "day23": _day23_spec,
+    "day24": _day24_spec,
+    "day25": _day25_spec,
+}
+
+
+def get_day(day: str) -> DaySpec:
+    if day not in ALL_DAYS:
+        raise KeyError(f"Unknown day: '{day}'")
+
+    if day in SPECIAL_CASES:
+        return SPECIAL_CASES[day]()
+
+    return _default_spec(day)
+
+
+def normalize_day(day: str) -> str:
+    """Accepts `5`, `05` and `day05`."""
+    if day.startswith("day"):
+        day = day[3:]
+
+    return f"day{int(day):02d}"
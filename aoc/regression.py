@@ -0,0 +1,219 @@
+"""Performance regression gate based on stored per-solver baselines
+
+Every solver phase is run several times, each time in a fresh process (so
+that the peak RSS belongs to that phase only and no caches survive between
+runs). The median and 95th percentile of the wall time, and the peak RSS are
+stored in a JSON baseline that is kept under version control.
+
+Usage (from the repository root):
+
+    python -m aoc.regression record --repeats 5     # (re)write the baseline
+    python -m aoc.regression check 15 19 23         # exits with 1 on regressions
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+from math import ceil
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.registry import ALL_DAYS, REPO_ROOT, get_day, normalize_day
+from aoc.runner import Job, Measurement, plan_jobs, read_job_data, run_job_phase
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+
+# Only the real puzzle inputs are tracked, the examples are too small to time
+DEFAULT_FILES = ["input.txt", "input"]
+
+
+class Stats(NamedTuple):
+    median: float
+    p95: float
+    peak_rss_kib: int
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile, well defined also for a handful of runs."""
+    ordered = sorted(values)
+    rank = max(1, ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _peak_rss_kib() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_isolated(job: Job) -> List[Tuple[Measurement, int]]:
+    """Measurements of `read_data` and the phase, each with its peak RSS.
+
+    The peak RSS of a process never goes down, so the one of `read_data` has
+    to be taken before the phase runs.
+    """
+    data, read = read_job_data(job, trace_memory=False)
+    read_rss_kib = _peak_rss_kib()
+
+    phase = run_job_phase(job, data, trace_memory=False)
+
+    return [(read, read_rss_kib), (phase, _peak_rss_kib())]
+
+
+def collect_stats(jobs: List[Job], repeats: int) -> Dict[str, Stats]:
+    # A new (spawned, not forked) process for every run, one run at a time,
+    # so that neither memory nor CPU is shared with other runs. An executor
+    # per run rather than `max_tasks_per_child=1`, which needs Python 3.11
+    wall_times: Dict[str, List[float]] = {}
+    peak_rss: Dict[str, int] = {}
+
+    for idx, job in enumerate(jobs):
+        print(f"[{idx + 1}/{len(jobs)}] {job.day} {os.path.basename(job.file)} {job.phase}")
+
+        for _ in range(repeats):
+            with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = executor.submit(_run_isolated, job).result()
+
+            for m, rss in results:
+                key = f"{m.day}/{m.file}/{m.phase}"
+                wall_times.setdefault(key, []).append(m.wall_time)
+                peak_rss[key] = max(peak_rss.get(key, 0), rss)
+
+    return {
+        key: Stats(
+            median=statistics.median(times),
+            p95=percentile(times, 95),
+            peak_rss_kib=peak_rss[key],
+        )
+        for key, times in wall_times.items()
+    }
+
+
+def load_baseline(path: str) -> Dict[str, Stats]:
+    with open(path, "r") as fin:
+        raw = json.load(fin)
+
+    return {key: Stats(**value) for key, value in raw["solvers"].items()}
+
+
+def save_baseline(path: str, stats: Dict[str, Stats], repeats: int):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    with open(path, "w") as fout:
+        json.dump({
+            "repeats": repeats,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "solvers": {key: s._asdict() for key, s in sorted(stats.items())},
+        }, fout, indent=2)
+        fout.write("\n")
+
+
+def find_regressions(
+    baseline: Dict[str, Stats],
+    current: Dict[str, Stats],
+    threshold: float,
+    min_delta: float,
+) -> List[str]:
+    """Compares medians and prints a report, returns the regressed keys.
+
+    Very short phases are noisy, so a phase only counts as regressed when it
+    is both relatively (`threshold`) and absolutely (`min_delta`) slower.
+    """
+    regressions = []
+
+    print(
+        f"{'Solver':<36} {'Base [s]':>10} {'Now [s]':>10} {'Ratio':>7} "
+        f"{'RSS base':>10} {'RSS now':>10}  Status"
+    )
+
+    for key, now in sorted(current.items()):
+        base = baseline.get(key)
+
+        if base is None:
+            print(f"{key:<36} {'-':>10} {now.median:>10.4f} {'-':>7} "
+                  f"{'-':>10} {now.peak_rss_kib:>10}  new")
+            continue
+
+        ratio = now.median / base.median if base.median > 0 else float("inf")
+        is_slower = (
+            now.median > base.median * (1 + threshold)
+            and now.median - base.median > min_delta
+        )
+
+        if is_slower:
+            regressions.append(key)
+
+        print(
+            f"{key:<36} {base.median:>10.4f} {now.median:>10.4f} {ratio:>7.2f} "
+            f"{base.peak_rss_kib:>10} {now.peak_rss_kib:>10}  "
+            f"{'REGRESSION' if is_slower else 'ok'}"
+        )
+
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=("record", "check"))
+    parser.add_argument(
+        "days", nargs="*",
+        help="Days to run, e.g. `5`, `05` or `day05` (default: all)",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--files", nargs="+", default=DEFAULT_FILES)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Allowed relative slowdown of the median (default: 25%%)",
+    )
+    parser.add_argument(
+        "--min-delta", type=float, default=0.005,
+        help="Slowdowns below this many seconds are ignored as noise",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+
+    days = [normalize_day(d) for d in args.days] or ALL_DAYS
+    jobs = plan_jobs([get_day(day) for day in days], files=args.files)
+
+    current = collect_stats(jobs, repeats=args.repeats)
+
+    if args.command == "record":
+        # Recording a subset of days keeps the other entries untouched
+        stats = {}
+        if os.path.exists(args.baseline):
+            stats = load_baseline(args.baseline)
+        stats.update(current)
+
+        save_baseline(args.baseline, stats, repeats=args.repeats)
+        print(f"Baseline written to: {args.baseline}")
+        return
+
+    regressions = find_regressions(
+        baseline=load_baseline(args.baseline),
+        current=current,
+        threshold=args.threshold,
+        min_delta=args.min_delta,
+    )
+
+    if regressions:
+        print(f"\n{len(regressions)} solver(s) got slower: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
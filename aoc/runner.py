@@ -0,0 +1,413 @@
+"""Runs the daily solvers and reports how much time and memory they take
+
+Usage (from any directory):
+
+    python -m aoc.runner                 # all days, all data files
+    python -m aoc.runner 5 9 15          # selected days
+    python -m aoc.runner --files input.txt --json results.json
+    python -m aoc.runner 5 --scales 1 10 100   # synthetic inputs
+    python -m aoc.runner --workers 8     # (day, file, part) jobs in parallel
+    python -m aoc.runner --cache         # reuse parsed inputs from disk
+    python -m aoc.runner 12 --profile profiles   # cProfile + flamegraph stacks
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from copy import deepcopy
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.cache import with_cache
+from aoc.memo import memo_stats, reset_memo_stats
+from aoc.generators import DEFAULT_SEED, GENERATORS, ensure_generated
+from aoc.profiling import profile_call
+from aoc.registry import ALL_DAYS, DaySpec, get_day, normalize_day
+
+
+class Measurement(NamedTuple):
+    day: str
+    file: str
+    phase: str
+    answer: Any
+    wall_time: float
+    cpu_time: float
+    peak_memory: Optional[int]
+    # Hits, misses and peak cache size of every memoized function called
+    memo: Optional[Dict[str, dict]] = None
+
+    def to_dict(self) -> dict:
+        out = self._asdict()
+        out["answer"] = repr(self.answer) if not isinstance(
+            self.answer, (int, str, type(None))
+        ) else self.answer
+        return out
+
+
+def measure(
+    function: Callable[..., Any],
+    *args: Any,
+    trace_memory: bool = True,
+    profile_prefix: Optional[str] = None,
+) -> Tuple[Any, float, float, Optional[int], Optional[Dict[str, dict]]]:
+    """Returns the result, wall time, CPU time, peak allocated bytes and the
+    statistics of the memoized functions (see `aoc.memo`).
+
+    The solvers print progress information (e.g., day 19), which is swallowed
+    so that it doesn't interleave with the report. With `profile_prefix` the
+    call runs under `cProfile` (see `aoc.profiling`), which makes it slower.
+    """
+    if trace_memory:
+        tracemalloc.start()
+
+    reset_memo_stats()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    try:
+        with redirect_stdout(io.StringIO()):
+            if profile_prefix is None:
+                result = function(*args)
+            else:
+                result = profile_call(
+                    function, *args, output_prefix=profile_prefix,
+                )
+    finally:
+        cpu_time = time.process_time() - cpu_start
+        wall_time = time.perf_counter() - wall_start
+
+        peak_memory = None
+        if trace_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    memo = {name: s._asdict() for name, s in memo_stats().items()} or None
+
+    return result, wall_time, cpu_time, peak_memory, memo
+
+
+def _profile_prefix(
+    profile_dir: Optional[str],
+    day: str,
+    label: str,
+    phase: str,
+) -> Optional[str]:
+    if profile_dir is None:
+        return None
+
+    return os.path.join(profile_dir, f"{day}-{label}-{phase}")
+
+
+def run_day(
+    spec: DaySpec,
+    files: Optional[List[str]] = None,
+    trace_memory: bool = True,
+    profile_dir: Optional[str] = None,
+) -> List[Measurement]:
+    measurements = []
+
+    for filename in spec.files:
+        label = os.path.basename(filename)
+
+        if files is not None and label not in files:
+            continue
+
+        data, *stats = measure(
+            spec.read_data, filename, trace_memory=trace_memory,
+            profile_prefix=_profile_prefix(
+                profile_dir, spec.name, label, "read_data",
+            ),
+        )
+        measurements.append(Measurement(spec.name, label, "read_data", None, *stats))
+
+        for phase in spec.phases:
+            # Some solvers mutate their input (e.g., marking bingo boards), so
+            # every phase gets a fresh copy, just like in the `main()`s
+            answer, *stats = measure(
+                phase.function, deepcopy(data), trace_memory=trace_memory,
+                profile_prefix=_profile_prefix(
+                    profile_dir, spec.name, label, phase.name,
+                ),
+            )
+            measurements.append(
+                Measurement(spec.name, label, phase.name, answer, *stats)
+            )
+
+    return measurements
+
+
+class Job(NamedTuple):
+    day: str
+    file: str
+    phase: str
+
+
+def plan_jobs(specs: List[DaySpec], files: Optional[List[str]] = None) -> List[Job]:
+    return [
+        Job(day=spec.name, file=filename, phase=phase.name)
+        for spec in specs
+        for filename in spec.files
+        if files is None or os.path.basename(filename) in files
+        for phase in spec.phases
+    ]
+
+
+def run_job(
+    job: Job,
+    trace_memory: bool = True,
+    use_cache: bool = False,
+    profile_dir: Optional[str] = None,
+    profile_read_data: bool = True,
+) -> List[Measurement]:
+    """Runs a single phase in isolation, reading the data on its own.
+
+    Returns the measurements of both `read_data` and the phase itself. Jobs
+    of the same file profile `read_data` to the same files, so in parallel
+    only one of them should do it (`profile_read_data`).
+    """
+    data, read = read_job_data(
+        job, trace_memory, use_cache,
+        profile_dir=profile_dir if profile_read_data else None,
+    )
+    phase = run_job_phase(job, data, trace_memory, profile_dir)
+
+    return [read, phase]
+
+
+def read_job_data(
+    job: Job,
+    trace_memory: bool = True,
+    use_cache: bool = False,
+    profile_dir: Optional[str] = None,
+) -> Tuple[Any, Measurement]:
+    """The first half of `run_job`, returns the data and its measurement."""
+    spec = get_day(job.day)
+    if use_cache:
+        spec = with_cache(spec)
+    label = os.path.basename(job.file)
+
+    data, *stats = measure(
+        spec.read_data, job.file, trace_memory=trace_memory,
+        profile_prefix=_profile_prefix(profile_dir, job.day, label, "read_data"),
+    )
+
+    return data, Measurement(job.day, label, "read_data", None, *stats)
+
+
+def run_job_phase(
+    job: Job,
+    data: Any,
+    trace_memory: bool = True,
+    profile_dir: Optional[str] = None,
+) -> Measurement:
+    """The second half of `run_job`, runs the phase on the data read before."""
+    label = os.path.basename(job.file)
+
+    answer, *stats = measure(
+        get_day(job.day).get_phase(job.phase).function, data,
+        trace_memory=trace_memory,
+        profile_prefix=_profile_prefix(profile_dir, job.day, label, job.phase),
+    )
+
+    return Measurement(job.day, label, job.phase, answer, *stats)
+
+
+def run_jobs_in_parallel(
+    jobs: List[Job],
+    num_workers: Optional[int] = None,
+    trace_memory: bool = True,
+    use_cache: bool = False,
+    profile_dir: Optional[str] = None,
+) -> List[Measurement]:
+    """Runs all jobs in a process pool, keeping the results in job order.
+
+    Every job parses its input file on its own, but `read_data` is reported
+    (and profiled) only once per file, from the first phase, just like in a
+    sequential run.
+    """
+    is_first_of_file = []
+    already_read = set()
+
+    for job in jobs:
+        is_first_of_file.append((job.day, job.file) not in already_read)
+        already_read.add((job.day, job.file))
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(
+                run_job, job, trace_memory, use_cache, profile_dir, is_first,
+            )
+            for job, is_first in zip(jobs, is_first_of_file)
+        ]
+        results = [future.result() for future in futures]
+
+    measurements = []
+
+    for is_first, (read, phase) in zip(is_first_of_file, results):
+        if is_first:
+            measurements.append(read)
+
+        measurements.append(phase)
+
+    return measurements
+
+
+def format_table(measurements: List[Measurement]) -> str:
+    header = (
+        f"{'Day':<6} {'File':<18} {'Phase':<10} "
+        f"{'Wall [s]':>10} {'CPU [s]':>10} {'Peak [KiB]':>12}  Answer"
+    )
+    lines = [header, "-" * len(header)]
+
+    for m in measurements:
+        peak = "-" if m.peak_memory is None else f"{m.peak_memory / 1024:.1f}"
+        answer = "" if m.answer is None else str(m.answer).replace("\n", " / ")
+
+        lines.append(
+            f"{m.day:<6} {m.file:<18} {m.phase:<10} "
+            f"{m.wall_time:>10.4f} {m.cpu_time:>10.4f} {peak:>12}  {answer}"
+        )
+
+    total_wall = sum(m.wall_time for m in measurements)
+    total_cpu = sum(m.cpu_time for m in measurements)
+    lines.append("-" * len(header))
+    lines.append(f"{'Total':<36} {total_wall:>10.4f} {total_cpu:>10.4f}")
+
+    memo_lines = [
+        f"{m.day:<6} {m.file:<18} {m.phase:<10} {name}: "
+        f"{s['hits']} hits, {s['misses']} misses, peak size {s['peak_size']}"
+        for m in measurements
+        if m.memo is not None
+        for name, s in m.memo.items()
+    ]
+
+    if memo_lines:
+        lines.extend(["", "Memoization:", *memo_lines])
+
+    return "\n".join(lines)
+
+
+def to_json(measurements: List[Measurement]) -> str:
+    return json.dumps([m.to_dict() for m in measurements], indent=2)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "days", nargs="*",
+        help="Days to run, e.g. `5`, `05` or `day05` (default: all)",
+    )
+    parser.add_argument(
+        "--files", nargs="+", default=None,
+        help="Only run these data files, e.g. `input.txt`",
+    )
+    parser.add_argument(
+        "--scales", nargs="+", type=int, default=None,
+        help=(
+            "Run on synthetic inputs of the given scales instead of the data "
+            "files (generated on first use, see `aoc.generators`)"
+        ),
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--json", dest="json_path", default=None,
+        help="Write the measurements as JSON to the given path (`-` = stdout)",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true",
+        help="Skip peak memory tracking (`tracemalloc` slows the solvers down)",
+    )
+    parser.add_argument(
+        "--workers", type=int, nargs="?", const=os.cpu_count(), default=None,
+        help=(
+            "Run every (day, file, part) job in a pool of worker processes "
+            "(default without a value: number of CPUs)"
+        ),
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help=(
+            "Load the parsed inputs from the on-disk cache, parsing (and "
+            "storing) them only on first use (see `aoc.cache`)"
+        ),
+    )
+    parser.add_argument(
+        "--profile", dest="profile_dir", default=None,
+        help=(
+            "Run every phase under cProfile and write `.pstats` and collapsed "
+            "stack (flamegraph) files to the given directory"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+
+    days = [normalize_day(d) for d in args.days] or ALL_DAYS
+
+    specs = []
+    for day in days:
+        spec = get_day(day)
+
+        if args.scales is not None:
+            if day not in GENERATORS:
+                print(f"Skipping {day}: no input generator", file=sys.stderr)
+                continue
+
+            spec = spec._replace(files=[
+                ensure_generated(day, scale, seed=args.seed)
+                for scale in args.scales
+            ])
+
+        if args.cache:
+            spec = with_cache(spec)
+
+        specs.append(spec)
+
+    start = time.perf_counter()
+
+    if args.workers is not None:
+        measurements = run_jobs_in_parallel(
+            jobs=plan_jobs(specs, files=args.files),
+            num_workers=args.workers,
+            trace_memory=not args.no_memory,
+            use_cache=args.cache,
+            profile_dir=args.profile_dir,
+        )
+    else:
+        measurements = []
+        for spec in specs:
+            measurements.extend(run_day(
+                spec=spec,
+                files=args.files,
+                trace_memory=not args.no_memory,
+                profile_dir=args.profile_dir,
+            ))
+
+    elapsed = time.perf_counter() - start
+
+    if args.json_path == "-":
+        print(to_json(measurements))
+        return
+
+    print(format_table(measurements))
+    print(f"Elapsed: {elapsed:.4f} s")
+
+    if args.json_path is not None:
+        with open(args.json_path, "w") as fout:
+            fout.write(to_json(measurements))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""Scaling benchmark of the alternative engines of a day
+
+Some days implement the same computation several times (e.g., the
+`simulate_fish_*` functions of day 6). Every engine is run on the puzzle
+input with a growing size argument (doubling it each time), until it hits
+the time or memory limit, fails or reaches the largest size. Each run is a
+fresh process with its address space capped, so a runaway engine can't
+take the machine down.
+
+The report lists the wall time and the peak RSS of every run, where each
+engine stopped being viable and how fast its time grows: the time ratio per
+doubling of the size and the exponent `k` of `time ~ size^k` between the
+last two runs (so exponential engines show a `k` growing with the size).
+
+Engines are all functions of the day's module with the suite's prefix, so
+new ones join the benchmark without any changes here.
+
+Usage (from the repository root):
+
+    python -m aoc.scaling day06
+    python -m aoc.scaling day06 --max-size 4096 --time-limit 1 --memory-limit 512
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+from math import log
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from typing import Any, List, NamedTuple, Optional
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.registry import REPO_ROOT, import_solver, normalize_day
+
+
+class Suite(NamedTuple):
+    day: str
+    prefix: str  # Engines are the functions of `dayNN/main.py` with it
+    size_argument: str  # Keyword argument of the engines with the size
+    file: str = "input.txt"
+
+
+SUITES = {
+    "day06": Suite(day="day06", prefix="simulate_fish_", size_argument="num_days"),
+}
+
+# Statuses of a run, all but `OK` end the runs of an engine
+OK = "ok"
+TIMEOUT = "timeout"
+OUT_OF_MEMORY = "out of memory"
+
+
+class Run(NamedTuple):
+    engine: str
+    size: int
+    status: str
+    wall_time: Optional[float]
+    peak_rss_kib: Optional[int]
+    answer: Any = None
+
+
+def find_engines(suite: Suite) -> List[str]:
+    """Names of the engines, in the order of their definition."""
+    module = import_solver(suite.day)
+
+    engines = [
+        function
+        for name, function in inspect.getmembers(module, inspect.isfunction)
+        if name.startswith(suite.prefix) and function.__module__ == module.__name__
+    ]
+    engines.sort(key=lambda function: function.__code__.co_firstlineno)
+
+    return [function.__name__ for function in engines]
+
+
+def _run_engine(
+    connection: Any,
+    suite: Suite,
+    engine: str,
+    size: int,
+    memory_limit_mib: Optional[int],
+):
+    if memory_limit_mib is not None:
+        limit = memory_limit_mib * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    try:
+        module = import_solver(suite.day)
+        data = module.read_data(os.path.join(REPO_ROOT, suite.day, "data", suite.file))
+        function = getattr(module, engine)
+
+        # The time limit starts now, without the interpreter start-up
+        connection.send(None)
+
+        wall_start = time.perf_counter()
+        answer = function(data, **{suite.size_argument: size})
+        wall_time = time.perf_counter() - wall_start
+
+        peak_rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        connection.send((OK, wall_time, peak_rss_kib, answer))
+    except MemoryError:
+        connection.send((OUT_OF_MEMORY, None, None, None))
+    except Exception as e:  # Any failure makes the engine non-viable
+        connection.send((f"error: {type(e).__name__}", None, None, None))
+
+
+def run_isolated(
+    suite: Suite,
+    engine: str,
+    size: int,
+    time_limit: float,
+    memory_limit_mib: Optional[int],
+) -> Run:
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+
+    process = context.Process(
+        target=_run_engine,
+        args=(sender, suite, engine, size, memory_limit_mib),
+    )
+    process.start()
+    sender.close()
+
+    try:
+        receiver.recv()  # Started
+        if receiver.poll(time_limit):
+            status, wall_time, peak_rss_kib, answer = receiver.recv()
+        else:
+            status, wall_time, peak_rss_kib, answer = TIMEOUT, None, None, None
+    except EOFError:  # Killed, e.g., when the memory limit hits the C stack
+        status, wall_time, peak_rss_kib, answer = "crashed", None, None, None
+    finally:
+        process.kill()
+        process.join()
+
+    return Run(
+        engine=engine,
+        size=size,
+        status=status,
+        wall_time=wall_time,
+        peak_rss_kib=peak_rss_kib,
+        answer=answer,
+    )
+
+
+def get_sizes(start: int, max_size: int) -> List[int]:
+    sizes = []
+
+    size = start
+    while size <= max_size:
+        sizes.append(size)
+        size *= 2
+
+    return sizes
+
+
+def run_suite(
+    suite: Suite,
+    sizes: List[int],
+    time_limit: float,
+    memory_limit_mib: Optional[int],
+    engines: Optional[List[str]] = None,
+) -> List[Run]:
+    """Runs every engine on growing sizes, until it stops being viable."""
+    runs = []
+
+    for engine in engines or find_engines(suite):
+        for size in sizes:
+            run = run_isolated(suite, engine, size, time_limit, memory_limit_mib)
+            runs.append(run)
+
+            print(
+                f"{engine} {suite.size_argument}={size}: {run.status}"
+                + (f" ({run.wall_time:.4f} s)" if run.status == OK else "")
+            )
+
+            if run.status != OK:
+                break
+
+    return runs
+
+
+def find_mismatches(runs: List[Run]) -> List[Run]:
+    """Runs with a different answer than the first engine with the same size."""
+    expected = {}
+    mismatches = []
+
+    for run in runs:
+        if run.status != OK:
+            continue
+
+        if run.size not in expected:
+            expected[run.size] = run.answer
+        elif run.answer != expected[run.size]:
+            mismatches.append(run)
+
+    return mismatches
+
+
+def format_report(suite: Suite, runs: List[Run]) -> str:
+    lines = [
+        f"{'Engine':<44} {suite.size_argument:>10} {'Wall [s]':>10} "
+        f"{'RSS [KiB]':>10}  Status"
+    ]
+
+    for run in runs:
+        wall_time = f"{run.wall_time:.4f}" if run.wall_time is not None else "-"
+        peak_rss = run.peak_rss_kib if run.peak_rss_kib is not None else "-"
+        lines.append(
+            f"{run.engine:<44} {run.size:>10} {wall_time:>10} "
+            f"{peak_rss:>10}  {run.status}"
+        )
+
+    lines.extend([
+        "",
+        "Growth rates:",
+        f"{'Engine':<44} {'Largest':>10} {'Ratio':>7} {'k':>6}  Stopped by",
+    ])
+
+    for engine in dict.fromkeys(run.engine for run in runs):
+        engine_runs = [run for run in runs if run.engine == engine]
+        viable = [run for run in engine_runs if run.status == OK]
+
+        stopped_by = engine_runs[-1].status
+        if stopped_by == OK:
+            stopped_by = "- (largest size reached)"
+
+        ratio = exponent = "-"
+        if len(viable) >= 2 and viable[-2].wall_time > 0:
+            previous, last = viable[-2], viable[-1]
+            time_ratio = last.wall_time / previous.wall_time
+            ratio = f"{time_ratio:.2f}"
+            exponent = f"{log(time_ratio) / log(last.size / previous.size):.2f}"
+
+        largest = viable[-1].size if viable else "-"
+        lines.append(
+            f"{engine:<44} {largest:>10} {ratio:>7} {exponent:>6}  {stopped_by}"
+        )
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("day", help=f"One of: {', '.join(SUITES)}")
+    parser.add_argument(
+        "--engines", nargs="+",
+        help="Only these engines (default: all with the suite's prefix)",
+    )
+    parser.add_argument("--start", type=int, default=16)
+    parser.add_argument("--max-size", type=int, default=1 << 16)
+    parser.add_argument(
+        "--time-limit", type=float, default=2.0,
+        help="Seconds per run, after the input is read (default: 2)",
+    )
+    parser.add_argument(
+        "--memory-limit", type=int, default=1024,
+        help="Address space limit of a run in MiB, 0 to disable (default: 1024)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+
+    day = normalize_day(args.day)
+    if day not in SUITES:
+        raise KeyError(f"No scaling suite for {day}, available: {', '.join(SUITES)}")
+
+    suite = SUITES[day]
+    runs = run_suite(
+        suite,
+        sizes=get_sizes(args.start, args.max_size),
+        time_limit=args.time_limit,
+        memory_limit_mib=args.memory_limit or None,
+        engines=args.engines,
+    )
+
+    print()
+    print(format_report(suite, runs))
+
+    mismatches = find_mismatches(runs)
+    if mismatches:
+        print(f"\n{len(mismatches)} run(s) disagree with the other engines:")
+        for run in mismatches:
+            print(f"* {run.engine} {suite.size_argument}={run.size}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
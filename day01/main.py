@@ -1,35 +1,125 @@
 """Day 1 - Advent of Code"""
+from itertools import islice
+from operator import gt
 import os
-from typing import List
+from typing import Dict, Iterable, Iterator, List
+
+
+def iter_data(lines: Iterable[str]) -> Iterator[int]:
+    """Parses the depths one by one, e.g., from an open file or `sys.stdin`."""
+    for line in lines:
+        yield int(line)
 
 
 def read_data(filename: str) -> List[int]:
     with open(filename, "r") as fin:
-        values = [int(line) for line in fin.readlines()]
-        return values
+        return list(iter_data(fin))
 
 
-def solve_part_one(data: List[int]) -> int:
+def solve_part_one(data: Iterable[int]) -> int:
+    if isinstance(data, list):
+        return count_window_increases(data, window_size=1)
+
     num_increased = 0
+    previous = None
 
-    for idx in range(0, len(data) - 1):
-        if data[idx + 1] > data[idx]:
+    for value in data:
+        if previous is not None and value > previous:
             num_increased += 1
 
+        previous = value
+
     return num_increased
 
 
-def solve_part_two(data: List[int], window_size: int = 3) -> int:
-    num_increased = 0
+def solve_part_two(data: Iterable[int], window_size: int = 3) -> int:
+    """Counts the windows with a larger sum than the previous window.
 
-    for idx in range(0, len(data) - window_size):
-        current_window_sum = sum(data[idx:idx + window_size])
-        next_window_sum = sum(data[idx + 1:idx + 1 + window_size])
+    Two consecutive windows share all but one value each, so the next window
+    has a larger sum exactly when the value entering it is larger than the one
+    leaving the current window. Iterators are consumed one depth at a time,
+    keeping only the last few depths (see `WindowIncreaseCounter`).
+    """
+    if isinstance(data, list):
+        return count_window_increases(data, window_size=window_size)
 
-        if next_window_sum > current_window_sum:
-            num_increased += 1
+    counter = WindowIncreaseCounter(window_size=window_size)
+    counter.update(data)
 
-    return num_increased
+    return counter.num_increased
+
+
+class WindowIncreaseCounter:
+    """Counts the window sum increases of a (possibly endless) depth stream.
+
+    Only a ring buffer of the last `window_size + 1` depths is kept, i.e., the
+    current and the previous window. The counts and both window sums are up
+    to date after every `push()`, so they can be read at any point.
+    """
+
+    def __init__(self, window_size: int = 3):
+        assert window_size > 0
+
+        self.window_size = window_size
+        self.num_depths = 0
+        self.num_increased = 0
+        self.window_sum = 0
+        self.previous_window_sum = None
+
+        self._buffer = [0] * (window_size + 1)
+
+    def push(self, depth: int) -> bool:
+        """Adds the next depth, returns whether its window sum increased."""
+        size = self.window_size + 1
+        is_increase = False
+
+        if self.num_depths >= self.window_size:
+            # The depth pushed `window_size` steps ago leaves the window
+            leaving = self._buffer[(self.num_depths + 1) % size]
+
+            self.previous_window_sum = self.window_sum
+            self.window_sum += depth - leaving
+
+            if depth > leaving:
+                self.num_increased += 1
+                is_increase = True
+        else:
+            self.window_sum += depth
+
+        self._buffer[self.num_depths % size] = depth
+        self.num_depths += 1
+
+        return is_increase
+
+    def update(self, depths: Iterable[int]) -> int:
+        """Pushes all depths, returns the number of increases so far."""
+        for depth in depths:
+            self.push(depth)
+
+        return self.num_increased
+
+
+def count_window_increases(data: List[int], window_size: int) -> int:
+    """Same as `solve_part_two`, but in a single C-level pass over a list.
+
+    With prefix sums `P`, the window starting at `idx + 1` has a larger sum
+    than the one starting at `idx` when `P[idx + 1 + w] - P[idx + 1]` is
+    larger than `P[idx + w] - P[idx]`, which simplifies to
+    `data[idx + w] > data[idx]`. So the prefix sums cancel out and it is
+    enough to compare the list with itself shifted by the window size.
+    """
+    return sum(map(gt, islice(data, window_size, None), data))
+
+
+def count_window_increases_batch(
+    data: List[int],
+    window_sizes: Iterable[int],
+) -> Dict[int, int]:
+    """Answers `count_window_increases` for many window sizes at once."""
+    return {
+        window_size: count_window_increases(data, window_size)
+        for window_size in window_sizes
+    }
 
 
 def main():
@@ -47,6 +137,16 @@ def main():
         # NOTE(pbielak): Part 1 can be also solved by calling `solve_part_two`
         assert solve_part_two(data, window_size=1) == solution_one
 
+        assert count_window_increases_batch(data, [1, 3, 5]) == {
+            1: solution_one,
+            3: solution_two,
+            5: solve_part_two(data, window_size=5),
+        }
+
+        counter = WindowIncreaseCounter(window_size=3)
+        assert counter.update(iter(data)) == solution_two
+        assert counter.window_sum == sum(data[-3:])
+
         print(
             f"File: {filename}\n"
             f"* Part One: {solution_one}\n"
@@ -0,0 +1,220 @@
+"""Day 2 - Advent of Code
+
+Both parts in a single module, working on compact arrays of commands instead
+of the `Command` objects of `part_1.py` and `part_2.py` (which are kept as the
+reference implementations).
+"""
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+import os
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Cached parses of the old `(part_1, part_2)` format must not be reused
+PARSER_VERSION = 2
+
+FORWARD = 0
+DOWN = 1
+UP = 2
+
+OPCODES = {"forward": FORWARD, "down": DOWN, "up": UP}
+BYTE_OPCODES = {name.encode(): opcode for name, opcode in OPCODES.items()}
+
+Command = Tuple[int, int]  # (opcode, value)
+
+
+class Data(NamedTuple):
+    opcodes: bytearray
+    values: array  # array("q")
+
+
+def iter_data(lines: Iterable[str]) -> Iterator[Command]:
+    """Parses the commands one by one, e.g., from an open file."""
+    for line in lines:
+        name, value = line.split()
+
+        if name not in OPCODES:
+            raise KeyError(f"Unknown command: '{name}'")
+
+        yield OPCODES[name], int(value)
+
+
+def read_data(filename: str) -> Data:
+    data = Data(opcodes=bytearray(), values=array("q"))
+
+    with open(filename, "r") as fin:
+        for opcode, value in iter_data(fin):
+            data.opcodes.append(opcode)
+            data.values.append(value)
+
+    return data
+
+
+class Summary(NamedTuple):
+    """The effect of a run of commands, starting from any position.
+
+    Starting with aim `a`, the commands move the submarine forward by `dx`,
+    change the aim by `daim` and the (part 2) depth by `ddepth + a * dx`. The
+    update is affine in the aim, so the summaries of consecutive runs can be
+    computed independently and merged with `then()`.
+    """
+    dx: int
+    daim: int
+    ddepth: int
+
+    def then(self, other: Summary) -> Summary:
+        return Summary(
+            dx=self.dx + other.dx,
+            daim=self.daim + other.daim,
+            ddepth=self.ddepth + other.ddepth + self.daim * other.dx,
+        )
+
+
+def summarize(commands: Iterable[Command]) -> Summary:
+    x = 0
+    aim = 0
+    depth = 0
+
+    for opcode, value in commands:
+        if opcode == FORWARD:
+            x += value
+            depth += aim * value
+        elif opcode == DOWN:
+            aim += value
+        else:
+            aim -= value
+
+    return Summary(dx=x, daim=aim, ddepth=depth)
+
+
+def solve_both(commands: Iterable[Command]) -> Tuple[int, int]:
+    """Follows the commands once, with the semantics of both parts.
+
+    The depth of part 1 is exactly the aim of part 2, so a single pass needs
+    just four integers of state. Works on streams of `(opcode, value)`.
+    """
+    summary = summarize(commands)
+    return summary.dx * summary.daim, summary.dx * summary.ddepth
+
+
+def iter_block(block: bytes) -> Iterator[Command]:
+    for line in block.split(b"\n"):
+        if not line:
+            continue
+
+        name, value = line.split()
+        yield BYTE_OPCODES[name], int(value)
+
+
+def summarize_byte_range(
+    filename: str,
+    start: int,
+    end: int,
+    block_size: int = 1 << 22,
+) -> Summary:
+    """Summarizes the commands on the lines starting in `[start, end)`.
+
+    The file is read in blocks, so the memory doesn't depend on the range.
+    """
+    summary = Summary(dx=0, daim=0, ddepth=0)
+
+    with open(filename, "rb") as fin:
+        if start > 0:
+            # A line crossing `start` belongs to the previous range
+            fin.seek(start - 1)
+            fin.readline()
+
+        position = fin.tell()
+
+        while position < end:
+            block = fin.read(min(block_size, end - position))
+            if not block:
+                break
+
+            position += len(block)
+
+            # Complete the last line, even if it ends past `end`
+            if not block.endswith(b"\n"):
+                rest = fin.readline()
+                position += len(rest)
+                block += rest
+
+            summary = summary.then(summarize(iter_block(block)))
+
+    return summary
+
+
+def split_into_byte_ranges(
+    filename: str,
+    num_chunks: int,
+) -> List[Tuple[int, int]]:
+    size = os.path.getsize(filename)
+    bounds = [size * idx // num_chunks for idx in range(num_chunks + 1)]
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def solve_both_in_parallel(
+    filename: str,
+    num_workers: Optional[int] = None,
+    num_chunks: Optional[int] = None,
+) -> Tuple[int, int]:
+    """`solve_both` for huge command files, reduced chunk-wise in processes.
+
+    Each worker summarizes a byte range of the file on its own, and the
+    summaries are merged in the file order.
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    num_chunks = num_chunks or 4 * num_workers
+
+    ranges = split_into_byte_ranges(filename, num_chunks)
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        summaries = list(executor.map(
+            summarize_byte_range,
+            [filename] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+        ))
+
+    summary = reduce(Summary.then, summaries, Summary(dx=0, daim=0, ddepth=0))
+    return summary.dx * summary.daim, summary.dx * summary.ddepth
+
+
+def solve_part_one(data: Data) -> int:
+    return solve_both(zip(data.opcodes, data.values))[0]
+
+
+def solve_part_two(data: Data) -> int:
+    return solve_both(zip(data.opcodes, data.values))[1]
+
+
+def main():
+    files = ["example.txt", "input.txt"]
+
+    for filename in files:
+        data = read_data(os.path.join("data", filename))
+
+        # Part 1 & 2
+        solution_one, solution_two = solve_both(zip(data.opcodes, data.values))
+
+        # Test cases
+        assert solve_both_in_parallel(
+            os.path.join("data", filename), num_workers=2, num_chunks=7,
+        ) == (solution_one, solution_two)
+
+        if filename == "example.txt":
+            assert solution_one == 150
+            assert solution_two == 900
+
+        print(
+            f"File: {filename}\n"
+            f"* Part One: {solution_one}\n"
+            f"* Part Two: {solution_two}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """Day 2 - Advent of Code"""
 from abc import abstractmethod
 import os
-from typing import List, NamedTuple
+from typing import Iterable, Iterator, List, NamedTuple
 
 
 class Position(NamedTuple):
@@ -52,12 +52,18 @@ class Down(Command):
         return Position(x=position.x, y=position.y + self._value)
 
 
+def iter_data(lines: Iterable[str]) -> Iterator[Command]:
+    """Parses the commands one by one, e.g., from an open file."""
+    for line in lines:
+        yield Command.from_str(line)
+
+
 def read_data(filename: str) -> List[Command]:
     with open(filename, "r") as fin:
-        return [Command.from_str(line) for line in fin.readlines()]
+        return list(iter_data(fin))
 
 
-def solve_part_one(data: List[Command]) -> int:
+def solve_part_one(data: Iterable[Command]) -> int:
     position = Position(x=0, y=0)
 
     for command in data:
@@ -1,7 +1,7 @@
 """Day 2 - Advent of Code"""
 from abc import abstractmethod
 import os
-from typing import List, NamedTuple
+from typing import Iterable, Iterator, List, NamedTuple
 
 
 class Position(NamedTuple):
@@ -65,12 +65,18 @@ class Down(Command):
         )
 
 
+def iter_data(lines: Iterable[str]) -> Iterator[Command]:
+    """Parses the commands one by one, e.g., from an open file."""
+    for line in lines:
+        yield Command.from_str(line)
+
+
 def read_data(filename: str) -> List[Command]:
     with open(filename, "r") as fin:
-        return [Command.from_str(line) for line in fin.readlines()]
+        return list(iter_data(fin))
 
 
-def solve_part_two(data: List[Command]) -> int:
+def solve_part_two(data: Iterable[Command]) -> int:
     position = Position(x=0, y=0, aim=0)
 
     for command in data:
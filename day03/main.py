@@ -1,39 +1,88 @@
 """Day 3 - Advent of Code"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate, compress, repeat
+from operator import and_, not_, rshift
 import os
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, NamedTuple
 
-Data = List[Tuple[int]]
+# Version 1 parsed the report into tuples of digits, version 2 didn't sort
+# the values yet
+PARSER_VERSION = 3
 
 
-def read_data(filename: str) -> Data:
-    numbers = []
-    with open(filename, "r") as fin:
-        for line in fin.readlines():
-            numbers.append(tuple(int(d) for d in line.strip()))
+class Report(NamedTuple):
+    """The diagnostic report, with every number packed into an `int`.
+
+    Equal numbers are stored once, together with how many times they occur,
+    so a report of narrow numbers takes at most `2 ** num_bits` entries no
+    matter how many lines it has. The values are sorted (see `ReportTrie`).
+    """
+    values: List[int]
+    weights: List[int]
+    num_bits: int
+
+    @property
+    def size(self) -> int:
+        return sum(self.weights)
 
-    return numbers
 
+def iter_data(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the binary numbers one by one, e.g., from an open file."""
+    for line in lines:
+        yield line.strip()
 
-def find_most_common_bits(data: Data) -> List[int]:
-    num_digits = len(data[0])
-    num_diagnostic_entries = len(data)
 
-    one_counts = [0] * num_digits
+def build_report(numbers: Iterable[str]) -> Report:
+    """Packs the binary numbers in a single pass (see `iter_data`)."""
+    histogram = Counter(numbers)
+    num_bits = max(map(len, histogram))
 
-    for number in data:
-        for idx in range(num_digits):
-            # We can add `0` as it won't change the counter
-            one_counts[idx] += number[idx]
+    weights = dict(zip(map(int, histogram, repeat(2)), histogram.values()))
+    values = sorted(weights)
+
+    return Report(
+        values=values,
+        weights=list(map(weights.__getitem__, values)),
+        num_bits=num_bits,
+    )
+
+
+def read_data(filename: str) -> Report:
+    with open(filename, "r") as fin:
+        return build_report(iter_data(fin))
 
-    most_common_bits = [
-        1 if one_counts[idx] >= num_diagnostic_entries / 2 else 0
-        for idx in range(num_digits)
+
+def get_bits(values: List[int], position: int) -> Iterator[int]:
+    """The bits of all values at `position` (counted from the right)."""
+    return map(and_, map(rshift, values, repeat(position)), repeat(1))
+
+
+def count_ones_per_column(report: Report) -> List[int]:
+    """Counts the ones in every column (from the left) of the report.
+
+    Works on the distinct values and their weights, so the cost depends on
+    the number of distinct values and not on the number of lines.
+    """
+    return [
+        # Masking is enough, `compress` only needs a truthy selector
+        sum(compress(report.weights, map(and_, report.values, repeat(mask))))
+        for mask in map((1).__lshift__, reversed(range(report.num_bits)))
     ]
 
-    return most_common_bits
 
+def find_most_common_bits(report: Report) -> List[int]:
+    num_diagnostic_entries = report.size
 
-def solve_part_one(data: Data) -> int:
+    return [
+        1 if one_count >= num_diagnostic_entries / 2 else 0
+        for one_count in count_ones_per_column(report)
+    ]
+
+
+def solve_part_one(data: Report) -> int:
     """Solution for part 1.
 
     The `gamma rate` is a binary number where each bit is the most common bit
@@ -43,9 +92,8 @@ def solve_part_one(data: Data) -> int:
     the epsilon rate as the negation of the gamma rate (if the most common bit
     at any position is `1`, the least common bit will be `0`, and vice versa).
     """
-    num_digits = len(data[0])
-
     most_common_bits = find_most_common_bits(data)
+    num_digits = len(most_common_bits)
 
     gamma_rate = int("".join([str(b) for b in most_common_bits]), base=2)
     epsilon_rate = ~gamma_rate & (2**num_digits - 1)
@@ -53,35 +101,75 @@ def solve_part_one(data: Data) -> int:
     return gamma_rate * epsilon_rate
 
 
-def filter_numbers(numbers: Data, use_most_common_bit: bool) -> int:
-    current_position = 0
+def filter_numbers(report: Report, use_most_common_bit: bool) -> int:
+    values = report.values
+    weights = report.weights
 
-    while len(numbers) != 1:
-        mcb = find_most_common_bits(numbers)
+    for position in reversed(range(report.num_bits)):
+        if len(values) == 1:
+            break
 
-        bit = (
-            mcb[current_position] if use_most_common_bit
-            else 1 - mcb[current_position]
-        )
+        bits = list(get_bits(values, position))
+        num_ones = sum(compress(weights, bits))
+        most_common_bit = 1 if num_ones >= sum(weights) / 2 else 0
 
-        numbers = [num for num in numbers if num[current_position] == bit]
-        current_position += 1
+        bit = most_common_bit if use_most_common_bit else 1 - most_common_bit
+        keep = bits if bit == 1 else list(map(not_, bits))
 
-    target_number = numbers[0]
+        values = list(compress(values, keep))
+        weights = list(compress(weights, keep))
 
-    return int("".join([str(d) for d in target_number]), base=2)
+    return values[0]
 
 
-def solve_part_two(data: Data) -> int:
-    oxygen_generator_rating = filter_numbers(
-        numbers=data,
-        use_most_common_bit=True,
-    )
+class ReportTrie:
+    """Binary trie of the report numbers, with the count of every subtree.
 
-    co2_scrubber_rating = filter_numbers(
-        numbers=data,
-        use_most_common_bit=False,
-    )
+    The trie is implicit: in the sorted `Report.values`, the numbers below
+    any node (i.e., sharing a prefix) form a contiguous range, split by the
+    next bit at the first value with that bit set. The boundaries are found
+    with `bisect` and the subtree counts come from the prefix sums of the
+    weights, so no node objects are allocated.
+    """
+
+    def __init__(self, report: Report):
+        self.num_bits = report.num_bits
+        self.values = report.values
+        self.cumulative_weights = [0, *accumulate(report.weights)]
+
+    def count(self, lo: int, hi: int) -> int:
+        """Number of report entries in the value range `[lo, hi)`."""
+        return self.cumulative_weights[hi] - self.cumulative_weights[lo]
+
+    def rating(self, use_most_common_bit: bool) -> int:
+        """Walks from the root, always to the majority (or minority) child."""
+        lo, hi = 0, len(self.values)
+        prefix = 0
+
+        for position in reversed(range(self.num_bits)):
+            if hi - lo == 1:
+                break
+
+            # First value below this node with the bit at `position` set
+            mid = bisect_left(self.values, prefix | (1 << position), lo, hi)
+
+            num_ones = self.count(mid, hi)
+            most_common_bit = 1 if num_ones >= self.count(lo, hi) / 2 else 0
+
+            if use_most_common_bit == (most_common_bit == 1):
+                lo = mid
+                prefix |= 1 << position
+            else:
+                hi = mid
+
+        return self.values[lo]
+
+
+def solve_part_two(data: Report) -> int:
+    trie = ReportTrie(data)
+
+    oxygen_generator_rating = trie.rating(use_most_common_bit=True)
+    co2_scrubber_rating = trie.rating(use_most_common_bit=False)
 
     return oxygen_generator_rating * co2_scrubber_rating
 
@@ -98,6 +186,20 @@ def main():
         # Part 2
         solution_two = solve_part_two(data)
 
+        # Test cases
+        assert solution_two == (
+            filter_numbers(report=data, use_most_common_bit=True)
+            * filter_numbers(report=data, use_most_common_bit=False)
+        )
+
+        # A billion-line report with the same distinct numbers (each repeated
+        # as often) has the same answers, at the cost of the distinct numbers
+        huge_report = data._replace(
+            weights=[weight * 1_000_000 for weight in data.weights],
+        )
+        assert solve_part_one(huge_report) == solution_one
+        assert solve_part_two(huge_report) == solution_two
+
         print(
             f"File: {filename}\n"
             f"* Part One: {solution_one}\n"
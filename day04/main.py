@@ -3,7 +3,10 @@ from __future__ import annotations
 
 from copy import deepcopy
 import os
-from typing import List, NamedTuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Cached boards from version 1 lack the counters of the O(1) marking
+PARSER_VERSION = 2
 
 
 class Data(NamedTuple):
@@ -12,42 +15,62 @@ class Data(NamedTuple):
 
 
 class Board:
+    """A bingo board with O(1) marking.
+
+    Every value is mapped to its cells and the board keeps the number of
+    marked cells in each row and column, and the sum of the unmarked values,
+    so nothing has to be rescanned when a number is drawn.
+    """
     SIZE = 5
 
     def __init__(self, values: List[List[int]]):
         self._values = values
+
+        # A number may appear more than once, all its cells are marked together
+        self._positions: Dict[int, List[Tuple[int, int]]] = {}
+        for i, row in enumerate(values):
+            for j, value in enumerate(row):
+                self._positions.setdefault(value, []).append((i, j))
+
+        self.reset()
+
+    def reset(self):
+        """Removes all marks, e.g., to replay another draw sequence."""
         self._is_marked: List[List[bool]] = [
             [False for _ in range(self.SIZE)]
             for _ in range(self.SIZE)
         ]
+        self._row_hits = [0] * self.SIZE
+        self._column_hits = [0] * self.SIZE
+        self._has_won = False
+        self._sum_of_unmarked = sum(sum(row) for row in self._values)
 
     def mark(self, number: int):
-        for i in range(self.SIZE):
-            for j in range(self.SIZE):
-                if self._values[i][j] == number:
-                    self._is_marked[i][j] = True
+        for i, j in self._positions.get(number, ()):
+            if self._is_marked[i][j]:
+                continue
 
-    def has_won(self) -> bool:
-        # Check rows
-        for i in range(self.SIZE):
-            if all(marked for marked in self._is_marked[i]):
-                return True
+            self._is_marked[i][j] = True
+            self._sum_of_unmarked -= number
 
-        # Check columns
-        for j in range(self.SIZE):
-            if all(self._is_marked[i][j] for i in range(self.SIZE)):
-                return True
+            self._row_hits[i] += 1
+            self._column_hits[j] += 1
 
-        return False
+            if (
+                self._row_hits[i] == self.SIZE
+                or self._column_hits[j] == self.SIZE
+            ):
+                self._has_won = True
+
+    def has_won(self) -> bool:
+        return self._has_won
 
     def sum_of_unmarked(self) -> int:
-        total = 0
-        for i in range(self.SIZE):
-            for j in range(self.SIZE):
-                if not self._is_marked[i][j]:
-                    total += self._values[i][j]
+        return self._sum_of_unmarked
 
-        return total
+    @property
+    def values(self) -> List[List[int]]:
+        return self._values
 
 
 def read_data(filename: str) -> Data:
@@ -71,7 +94,167 @@ def read_data(filename: str) -> Data:
     return data
 
 
+def get_draw_ranks(numbers: List[int]) -> Dict[int, int]:
+    """Maps every drawn number to the turn in which it's drawn first."""
+    ranks = {}
+    for turn, n in enumerate(numbers):
+        ranks.setdefault(n, turn)
+
+    return ranks
+
+
+def get_winning_turn(board: Board, ranks: Dict[int, int], never: int) -> int:
+    """The turn in which the board wins, or `never` if it doesn't.
+
+    A line is complete once its last number is drawn, i.e., in the turn of
+    the largest rank among its numbers, and the board wins with its first
+    complete line.
+    """
+    rows = board.values
+    cell_ranks = [[ranks.get(v, never) for v in row] for row in rows]
+
+    return min(
+        min(max(row) for row in cell_ranks),
+        min(max(column) for column in zip(*cell_ranks)),
+    )
+
+
+def get_score(
+    board: Board,
+    ranks: Dict[int, int],
+    numbers: List[int],
+    turn: int,
+) -> int:
+    """Score of a board winning in `turn`, without marking anything."""
+    sum_of_unmarked = sum(
+        v
+        for row in board.values
+        for v in row
+        if ranks.get(v, turn + 1) > turn
+    )
+
+    return sum_of_unmarked * numbers[turn]
+
+
+def find_winner(data: Data, last: bool = False) -> Optional[int]:
+    """Scores the first (or the last) winning board, using the draw ranks.
+
+    Ties are broken by the board order, just like in the simulation, where
+    all boards are marked in order within each turn.
+    """
+    never = len(data.numbers)
+    ranks = get_draw_ranks(data.numbers)
+
+    winning_turns = [
+        get_winning_turn(board, ranks, never)
+        for board in data.boards
+    ]
+
+    if last:
+        turn = max(winning_turns)
+        # The last of the boards winning in this turn
+        board_idx = len(winning_turns) - 1 - winning_turns[::-1].index(turn)
+    else:
+        turn = min(winning_turns)
+        board_idx = winning_turns.index(turn)
+
+    if turn == never:  # (Some) boards never win
+        return None
+
+    return get_score(data.boards[board_idx], ranks, data.numbers, turn)
+
+
 def solve_part_one(data: Data) -> int:
+    return find_winner(data)
+
+
+def solve_part_two(data: Data) -> int:
+    return find_winner(data, last=True)
+
+
+class Winner(NamedTuple):
+    turn: int
+    board: int  # Index in `Data.boards`
+    score: int
+
+
+class BoardBatch:
+    """The marking state of all boards at once, in flat arrays.
+
+    Cell `(i, j)` of board `b` has the index `(b * SIZE + i) * SIZE + j` and
+    an inverted index maps every number to all cells (of all boards) holding
+    it. So a draw touches only the cells with the drawn number, plus the hit
+    counter of their row and column, instead of looping over the boards.
+    """
+
+    def __init__(self, boards: List[Board]):
+        size = Board.SIZE
+
+        self.num_boards = len(boards)
+        self.cells_by_value: Dict[int, List[int]] = {}
+
+        for b, board in enumerate(boards):
+            for i, row in enumerate(board.values):
+                for j, value in enumerate(row):
+                    cell = (b * size + i) * size + j
+                    self.cells_by_value.setdefault(value, []).append(cell)
+
+        self.is_marked = bytearray(self.num_boards * size * size)
+        self.row_hits = bytearray(self.num_boards * size)
+        self.column_hits = bytearray(self.num_boards * size)
+        self.has_won = bytearray(self.num_boards)
+        self.sums_of_unmarked = [
+            sum(sum(row) for row in board.values)
+            for board in boards
+        ]
+
+    def draw(self, number: int) -> List[int]:
+        """Marks the number on all boards, returns the new winners in order.
+
+        The cells are indexed in the board order, so the winners are too.
+        """
+        size = Board.SIZE
+        winners = []
+
+        for cell in self.cells_by_value.get(number, ()):
+            if self.is_marked[cell]:
+                continue
+
+            self.is_marked[cell] = 1
+
+            board_row, j = divmod(cell, size)
+            b, i = divmod(board_row, size)
+            board_column = b * size + j
+
+            self.sums_of_unmarked[b] -= number
+            self.row_hits[board_row] += 1
+            self.column_hits[board_column] += 1
+
+            if not self.has_won[b] and (
+                self.row_hits[board_row] == size
+                or self.column_hits[board_column] == size
+            ):
+                self.has_won[b] = 1
+                winners.append(b)
+
+        return winners
+
+
+def iter_winners(
+    boards: List[Board],
+    numbers: Iterable[int],
+) -> Iterator[Winner]:
+    """Streams the draws, yielding the winning boards as soon as they win."""
+    batch = BoardBatch(boards)
+
+    for turn, n in enumerate(numbers):
+        # All cells with `n` are marked before scoring, as in the simulation
+        for b in batch.draw(n):
+            score = batch.sums_of_unmarked[b] * n
+            yield Winner(turn=turn, board=b, score=score)
+
+
+def simulate_part_one(data: Data) -> int:
     for n in data.numbers:
         for board in data.boards:
             board.mark(number=n)
@@ -80,7 +263,7 @@ def solve_part_one(data: Data) -> int:
                 return board.sum_of_unmarked() * n
 
 
-def solve_part_two(data: Data) -> int:
+def simulate_part_two(data: Data) -> int:
     num_boards = len(data.boards)
     num_winning_boards = 0
 
@@ -110,6 +293,26 @@ def main():
         # Part 2
         solution_two = solve_part_two(deepcopy(data))
 
+        # Test cases
+        assert solution_one == simulate_part_one(deepcopy(data))
+        assert solution_two == simulate_part_two(deepcopy(data))
+
+        winners = list(iter_winners(data.boards, data.numbers))
+        assert winners[0].score == solution_one
+        assert winners[-1].score == solution_two
+
+        if filename == "example.txt":
+            # A number repeated on a board marks all of its cells
+            board = Board(values=[[99] * Board.SIZE] + [
+                [Board.SIZE * i + j for j in range(Board.SIZE)]
+                for i in range(1, Board.SIZE)
+            ])
+            repeated = Data(numbers=[1, 99], boards=[board])
+            expected_score = 99 * sum(range(Board.SIZE, Board.SIZE ** 2))
+
+            assert simulate_part_one(deepcopy(repeated)) == expected_score
+            assert find_winner(repeated) == expected_score
+
         print(
             f"File: {filename}\n"
             f"* Part One: {solution_one}\n"
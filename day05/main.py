@@ -2,9 +2,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import inf
 import os
-from typing import Dict, Generator, List, Tuple
+from typing import (
+    Dict, Generator, Iterable, Iterator, List, NamedTuple, Optional, Tuple,
+)
 
 Point2D = Tuple[int, int]
 
@@ -29,6 +35,19 @@ class Line(ABC):
     def get_points(self) -> Generator[Point2D, None, None]:
         pass
 
+    @abstractmethod
+    def get_endpoints(self) -> Tuple[Point2D, Point2D]:
+        pass
+
+    @abstractmethod
+    def get_flat_slice(self, width: int) -> slice:
+        """The points of the line in a row-major grid with the given width.
+
+        Every line is an arithmetic progression of flat indices, so all of its
+        points can be read or written with a single strided slice.
+        """
+        pass
+
 
 def custom_range(start: int, end: int) -> List[int]:
     """Handles cases where `start` > `end`."""
@@ -49,6 +68,13 @@ class HorizontalLine(Line):
         for x in custom_range(self.x1, self.x2):
             yield x, self.y
 
+    def get_endpoints(self) -> Tuple[Point2D, Point2D]:
+        return (self.x1, self.y), (self.x2, self.y)
+
+    def get_flat_slice(self, width: int) -> slice:
+        start = self.y * width + min(self.x1, self.x2)
+        return slice(start, start + abs(self.x2 - self.x1) + 1)
+
 
 class VerticalLine(Line):
 
@@ -61,6 +87,14 @@ class VerticalLine(Line):
         for y in custom_range(self.y1, self.y2):
             yield self.x, y
 
+    def get_endpoints(self) -> Tuple[Point2D, Point2D]:
+        return (self.x, self.y1), (self.x, self.y2)
+
+    def get_flat_slice(self, width: int) -> slice:
+        start = min(self.y1, self.y2) * width + self.x
+        stop = start + abs(self.y2 - self.y1) * width + 1
+        return slice(start, stop, width)
+
 
 class DiagonalLine(Line):
 
@@ -77,19 +111,41 @@ class DiagonalLine(Line):
         for x, y in zip(xs, ys):
             yield x, y
 
+    def get_endpoints(self) -> Tuple[Point2D, Point2D]:
+        return (self.x1, self.y1), (self.x2, self.y2)
+
+    def get_flat_slice(self, width: int) -> slice:
+        # Walk from the top endpoint, so that the step is always positive
+        (x_top, y_top), (x_bottom, _) = sorted(
+            self.get_endpoints(), key=lambda point: point[1],
+        )
+        step = width + 1 if x_bottom > x_top else width - 1
+
+        start = y_top * width + x_top
+        stop = start + abs(self.x2 - self.x1) * step + 1
+        return slice(start, stop, step)
+
 
 Data = List[Line]
 
 
+def iter_data(lines: Iterable[str]) -> Iterator[Line]:
+    """Parses the vent lines one by one, e.g., from an open file."""
+    for line in lines:
+        yield Line.from_string(line.strip())
+
+
 def read_data(filename: str) -> Data:
     with open(filename, "r") as fin:
-        return [
-            Line.from_string(line.strip())
-            for line in fin.readlines()
-        ]
+        return list(iter_data(fin))
+
 
+def get_point_count_grid(data: Iterable[Line]) -> Dict[Point2D, int]:
+    """Counts the lines at every point, in a single pass over the lines.
 
-def get_point_count_grid(data: List[Line]) -> Dict[Point2D, int]:
+    Only the counts are kept, so the memory depends on the number of covered
+    points and not on the number of lines.
+    """
     num_lines_at_point = defaultdict(int)
 
     for line in data:
@@ -99,7 +155,7 @@ def get_point_count_grid(data: List[Line]) -> Dict[Point2D, int]:
     return num_lines_at_point
 
 
-def num_points_where_at_least_two_lines(data: List[Line]) -> int:
+def num_points_where_at_least_two_lines(data: Iterable[Line]) -> int:
     num_lines_at_point = get_point_count_grid(data)
 
     solution = 0
@@ -110,14 +166,438 @@ def num_points_where_at_least_two_lines(data: List[Line]) -> int:
     return solution
 
 
-def solve_part_one(data: Data) -> int:
-    return num_points_where_at_least_two_lines([
+# Line counts saturate at 2 - enough for the puzzle and they fit into bytes
+SATURATING_INCREMENT = bytes([1] + [2] * 255)
+
+
+class DenseGrid(NamedTuple):
+    counts: bytearray  # row-major, saturated at 2
+    width: int
+    height: int
+
+
+def get_grid_shape(data: Iterable[Line]) -> Tuple[int, int]:
+    """Width and height of the smallest grid at the origin with all lines."""
+    width = height = 0
+
+    for line in data:
+        for x, y in line.get_endpoints():
+            width = max(width, x + 1)
+            height = max(height, y + 1)
+
+    return width, height
+
+
+def get_dense_point_count_grid(data: Iterable[Line]) -> DenseGrid:
+    """Rasterizes the lines into a dense grid sized to the input bounds.
+
+    Each line is a strided slice of the flat grid, which is incremented with a
+    single `bytes.translate` call - the points are never materialized in
+    Python. The time is proportional to the total length of the lines, but
+    the memory is `width * height` bytes, so the coordinates must stay
+    moderate. The shape needs its own pass, so all lines are kept in memory.
+    """
+    lines = list(data)
+    width, height = get_grid_shape(lines)
+
+    return DenseGrid(
+        counts=rasterize(lines, width, height),
+        width=width,
+        height=height,
+    )
+
+
+def rasterize(lines: List[Line], width: int, height: int) -> bytearray:
+    counts = bytearray(width * height)
+
+    for line in lines:
+        points = line.get_flat_slice(width)
+        counts[points] = counts[points].translate(SATURATING_INCREMENT)
+
+    return counts
+
+
+def rasterize_rows(
+    lines: List[Line],
+    width: int,
+    first_row: int,
+    last_row: int,
+) -> bytearray:
+    """`rasterize` limited to the rows `[first_row, last_row)` of the grid.
+
+    The rows are a contiguous range of flat indices, so every line is clipped
+    to them by slicing the `range` of its flat indices.
+    """
+    lo = first_row * width
+    hi = last_row * width
+    counts = bytearray(hi - lo)
+
+    for line in lines:
+        flat_points = line.get_flat_slice(width)
+        points = range(flat_points.stop)[flat_points]
+
+        first = max(0, -((points.start - lo) // points.step))
+        last = max(0, -((points.start - hi) // points.step))
+        points = points[first:last]
+
+        if points:
+            local = slice(points.start - lo, points.stop - lo, points.step)
+            counts[local] = counts[local].translate(SATURATING_INCREMENT)
+
+    return counts
+
+
+def get_row_range(line: Line) -> Tuple[int, int]:
+    (_, y1), (_, y2) = line.get_endpoints()
+    return min(y1, y2), max(y1, y2)
+
+
+def get_dense_point_count_grid_in_parallel(
+    data: Iterable[Line],
+    num_workers: Optional[int] = None,
+    num_bands: Optional[int] = None,
+) -> DenseGrid:
+    """`get_dense_point_count_grid` with the rows split between processes.
+
+    Each worker rasterizes a band of rows into a private array, using only
+    the lines crossing the band, and the bands are concatenated in order.
+    Nothing is shared or merged and the memory of a worker is its band only.
+    """
+    lines = list(data)
+    width, height = get_grid_shape(lines)
+
+    num_workers = num_workers or os.cpu_count() or 1
+    num_bands = max(1, min(num_bands or num_workers, height))
+
+    bounds = [height * idx // num_bands for idx in range(num_bands + 1)]
+    row_ranges = [get_row_range(line) for line in lines]
+
+    lines_by_band = [
+        [
+            line
+            for line, (top, bottom) in zip(lines, row_ranges)
+            if top < last_row and bottom >= first_row
+        ]
+        for first_row, last_row in zip(bounds[:-1], bounds[1:])
+    ]
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        bands = executor.map(
+            rasterize_rows,
+            lines_by_band,
+            [width] * num_bands,
+            bounds[:-1],
+            bounds[1:],
+        )
+        counts = bytearray().join(bands)
+
+    return DenseGrid(counts=counts, width=width, height=height)
+
+
+def count_points_with_at_least_two_lines(counts: bytearray) -> int:
+    return len(counts) - counts.count(0) - counts.count(1)
+
+
+def count_overlaps_rasterized(data: Iterable[Line]) -> int:
+    counts = get_dense_point_count_grid(data).counts
+    return count_points_with_at_least_two_lines(counts)
+
+
+def count_overlaps_rasterized_in_parallel(
+    data: Iterable[Line],
+    num_workers: Optional[int] = None,
+    num_bands: Optional[int] = None,
+) -> int:
+    counts = get_dense_point_count_grid_in_parallel(
+        data, num_workers=num_workers, num_bands=num_bands,
+    ).counts
+    return count_points_with_at_least_two_lines(counts)
+
+
+# Directions of the carriers (the infinite lines through the vent lines)
+HORIZONTAL = 0
+VERTICAL = 1
+DIAGONAL = 2  # x - y is constant
+ANTIDIAGONAL = 3  # x + y is constant
+
+DIRECTIONS = (HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL)
+
+# `(a, b)`, such that `a * x + b * y` is constant along a carrier
+NORMALS = {
+    HORIZONTAL: (0, 1),
+    VERTICAL: (1, 0),
+    DIAGONAL: (1, -1),
+    ANTIDIAGONAL: (1, 1),
+}
+
+Carrier = Tuple[int, int]  # (direction, offset)
+Interval = Tuple[int, int]  # (start, end), both inclusive
+
+
+def get_offset(direction: int, x: int, y: int) -> int:
+    a, b = NORMALS[direction]
+    return a * x + b * y
+
+
+def get_position(direction: int, x: int, y: int) -> int:
+    """Position of a point along its carrier, in steps between its points."""
+    return y if direction == VERTICAL else x
+
+
+def get_point(direction: int, offset: int, position: int) -> Point2D:
+    if direction == HORIZONTAL:
+        return position, offset
+    elif direction == VERTICAL:
+        return offset, position
+    elif direction == DIAGONAL:
+        return position, position - offset
+    else:
+        return position, offset - position
+
+
+def get_carrier_interval(line: Line) -> Tuple[Carrier, Interval]:
+    (x1, y1), (x2, y2) = line.get_endpoints()
+
+    if y1 == y2:
+        direction = HORIZONTAL
+    elif x1 == x2:
+        direction = VERTICAL
+    elif (x2 - x1) == (y2 - y1):
+        direction = DIAGONAL
+    else:
+        direction = ANTIDIAGONAL
+
+    start = get_position(direction, x1, y1)
+    end = get_position(direction, x2, y2)
+
+    return (
+        (direction, get_offset(direction, x1, y1)),
+        (min(start, end), max(start, end)),
+    )
+
+
+def merge_intervals(
+    intervals: List[Interval],
+) -> Tuple[List[Interval], List[Interval]]:
+    """Positions covered by at least one and by at least two intervals.
+
+    Both results are sorted lists of disjoint intervals.
+    """
+    events = sorted(
+        [(start, 1) for start, _ in intervals]
+        + [(end + 1, -1) for _, end in intervals]
+    )
+
+    covered: List[Interval] = []
+    overlapped: List[Interval] = []
+
+    depth = 0
+    previous = events[0][0]
+
+    for position, delta in events:
+        if position > previous:
+            if depth >= 1:
+                _append_interval(covered, previous, position - 1)
+            if depth >= 2:
+                _append_interval(overlapped, previous, position - 1)
+
+        depth += delta
+        previous = position
+
+    return covered, overlapped
+
+
+def _append_interval(intervals: List[Interval], start: int, end: int):
+    if intervals and intervals[-1][1] + 1 == start:
+        intervals[-1] = (intervals[-1][0], end)
+    else:
+        intervals.append((start, end))
+
+
+def contains(intervals: List[Interval], position: int) -> bool:
+    idx = bisect_right(intervals, (position, inf)) - 1
+    return idx >= 0 and intervals[idx][1] >= position
+
+
+def find_orthogonal_crossings(
+    vertical: List[Tuple[int, int, int]],
+    horizontal: List[Tuple[int, int, int]],
+) -> Iterator[Point2D]:
+    """Crossings of `(u, v_lo, v_hi)` and `(v, u_lo, u_hi)` segments.
+
+    A sweep over `u`: horizontal segments are active between their ends and
+    every vertical segment reports the active ones in its `v` range.
+    """
+    insert, query, remove = 0, 1, 2  # Order of the events at the same `u`
+
+    events = []
+    for v, lo, hi in horizontal:
+        events.append((lo, insert, v, v))
+        events.append((hi, remove, v, v))
+
+    for u, lo, hi in vertical:
+        events.append((u, query, lo, hi))
+
+    events.sort()
+
+    active: List[int] = []
+    for u, kind, lo, hi in events:
+        if kind == insert:
+            insort(active, lo)
+        elif kind == query:
+            for v in active[bisect_left(active, lo):bisect_right(active, hi)]:
+                yield u, v
+        else:
+            del active[bisect_left(active, lo)]
+
+
+def find_crossings(
+    first: int,
+    second: int,
+    covered: Dict[Carrier, List[Interval]],
+) -> Iterator[Point2D]:
+    """Lattice points covered by carriers of both directions.
+
+    In the coordinates `(offset in first, offset in second)` the carriers of
+    the two directions are orthogonal and axis-aligned. The map is one-to-one
+    on lattice points, except for the two diagonals, where the point between
+    two carriers is only a lattice point if the offsets have the same parity.
+    """
+    segments: Dict[int, List[Tuple[int, int, int]]] = {first: [], second: []}
+    other = {first: second, second: first}
+
+    for (direction, offset), intervals in covered.items():
+        if direction not in segments:
+            continue
+
+        across = other[direction]
+
+        for start, end in intervals:
+            lo = get_offset(across, *get_point(direction, offset, start))
+            hi = get_offset(across, *get_point(direction, offset, end))
+            segments[direction].append((offset, min(lo, hi), max(lo, hi)))
+
+    (a1, b1), (a2, b2) = NORMALS[first], NORMALS[second]
+    determinant = a1 * b2 - a2 * b1
+
+    for c1, c2 in find_orthogonal_crossings(segments[first], segments[second]):
+        x, x_remainder = divmod(c1 * b2 - c2 * b1, determinant)
+        y, y_remainder = divmod(a1 * c2 - a2 * c1, determinant)
+
+        if x_remainder == 0 and y_remainder == 0:
+            yield x, y
+
+
+def count_overlaps_analytic(data: Iterable[Line]) -> int:
+    """Counts the points with at least two lines without visiting the points.
+
+    A point is covered twice if two collinear lines overlap there, or if it
+    lies on lines of two different directions. The first case is a sweep over
+    the intervals on each carrier, the second one a segment intersection
+    sweep for each pair of directions. The cost depends on the number of
+    lines and crossings, not on the magnitude of the coordinates.
+    """
+    intervals_by_carrier: Dict[Carrier, List[Interval]] = defaultdict(list)
+
+    for line in data:
+        carrier, interval = get_carrier_interval(line)
+        intervals_by_carrier[carrier].append(interval)
+
+    covered: Dict[Carrier, List[Interval]] = {}
+    overlapped: Dict[Carrier, List[Interval]] = {}
+
+    for carrier, intervals in intervals_by_carrier.items():
+        covered[carrier], overlapped[carrier] = merge_intervals(intervals)
+
+    solution = sum(
+        end - start + 1
+        for intervals in overlapped.values()
+        for start, end in intervals
+    )
+
+    crossings = set()
+    for first, second in combinations(DIRECTIONS, 2):
+        crossings.update(find_crossings(first, second, covered))
+
+    # Crossings are missing from the sum, unless they are an overlap of some
+    # carrier already - and then they may have been counted more than once
+    overlapped = {
+        carrier: intervals
+        for carrier, intervals in overlapped.items()
+        if intervals
+    }
+
+    for x, y in crossings:
+        num_overlaps = 0
+
+        for carrier, position in (
+            ((HORIZONTAL, y), x),
+            ((VERTICAL, x), y),
+            ((DIAGONAL, x - y), x),
+            ((ANTIDIAGONAL, x + y), x),
+        ):
+            intervals = overlapped.get(carrier)
+            if intervals is not None and contains(intervals, position):
+                num_overlaps += 1
+
+        solution += 1 - num_overlaps if num_overlaps > 0 else 1
+
+    return solution
+
+
+# The dense grid is used up to this size (in bytes)
+MAX_RASTER_CELLS = 1 << 26
+
+
+def count_overlaps(
+    data: Iterable[Line],
+    num_workers: Optional[int] = None,
+) -> int:
+    """Rasterizes small maps and falls back to the analytic count otherwise.
+
+    With `num_workers > 1`, the rows of the grid are rasterized in that many
+    processes (see `get_dense_point_count_grid_in_parallel`). The analytic
+    count always runs in the current process.
+    """
+    lines = list(data)
+    width, height = get_grid_shape(lines)
+
+    if width * height > MAX_RASTER_CELLS:
+        return count_overlaps_analytic(lines)
+
+    if num_workers is not None and num_workers > 1:
+        return count_overlaps_rasterized_in_parallel(
+            lines, num_workers=num_workers,
+        )
+
+    return count_overlaps_rasterized(lines)
+
+
+def only_straight_lines(data: Iterable[Line]) -> Iterator[Line]:
+    return (
         line for line in data
         if isinstance(line, (HorizontalLine, VerticalLine))
-    ])
+    )
+
+
+def solve_part_one(
+    data: Iterable[Line],
+    num_workers: Optional[int] = None,
+) -> int:
+    if isinstance(data, list):
+        return count_overlaps(only_straight_lines(data), num_workers)
 
+    # Iterators are consumed in a single pass, keeping only the point counts
+    return num_points_where_at_least_two_lines(only_straight_lines(data))
+
+
+def solve_part_two(
+    data: Iterable[Line],
+    num_workers: Optional[int] = None,
+) -> int:
+    if isinstance(data, list):
+        return count_overlaps(data, num_workers)
 
-def solve_part_two(data: Data) -> int:
     return num_points_where_at_least_two_lines(data)
 
 
@@ -133,6 +613,27 @@ def main():
         # Part 2
         solution_two = solve_part_two(data)
 
+        # Test cases
+        assert solution_one == num_points_where_at_least_two_lines(
+            only_straight_lines(data)
+        )
+        assert solution_two == num_points_where_at_least_two_lines(data)
+        assert solution_two == solve_part_two(iter(data))
+
+        straight_lines = list(only_straight_lines(data))
+        assert solution_one == count_overlaps_analytic(straight_lines)
+        assert solution_two == count_overlaps_analytic(data)
+
+        assert solution_one == solve_part_one(data, num_workers=2)
+        assert solution_two == solve_part_two(data, num_workers=2)
+        assert solution_two == count_overlaps_rasterized_in_parallel(
+            data, num_workers=2, num_bands=3,
+        )
+
+        if filename == "example.txt":
+            assert solution_one == 5
+            assert solution_two == 12
+
         print(
             f"File: {filename}\n"
             f"* Part One: {solution_one}\n"
@@ -1,10 +1,14 @@
 """Day 6 - Advent of Code"""
 from __future__ import annotations
 
-
-from functools import lru_cache
+from operator import mul
 import os
-from typing import List, Tuple
+import sys
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.memo import memoize  # noqa: E402
 
 Data = List[int]
 
@@ -108,18 +112,21 @@ def simulate_fish_using_recursive_function(data: Data, num_days: int) -> int:
     fish = data.copy()
 
     total = 0
-    for fish_timer in fish:
-        total += (
-            # Count the fish we are currently considering....
-            1
-            # and the fish produced by it
-            + compute_num_new_fish(day=0, max_day=num_days, fish_timer=fish_timer)
-        )
+
+    # All fish share the same cache, which is dropped once they are counted
+    with compute_num_new_fish.scope():
+        for fish_timer in fish:
+            total += (
+                # Count the fish we are currently considering....
+                1
+                # and the fish produced by it
+                + compute_num_new_fish(day=0, max_day=num_days, fish_timer=fish_timer)
+            )
 
     return total
 
 
-@lru_cache(maxsize=None)
+@memoize
 def compute_num_new_fish(day: int, max_day: int, fish_timer: int) -> int:
     if day == max_day:
         return 0
@@ -134,6 +141,163 @@ def compute_num_new_fish(day: int, max_day: int, fish_timer: int) -> int:
     return compute_num_new_fish(day + 1, max_day, fish_timer - 1)
 
 
+Matrix = List[List[int]]
+
+NUM_TIMERS = NEW_FISH_TIMER + 1
+
+
+def count_timers(data: Data) -> List[int]:
+    """Number of fish with each timer value (the population is all we need)."""
+    counts = [0] * NUM_TIMERS
+
+    for timer in data:
+        counts[timer] += 1
+
+    return counts
+
+
+def get_transition_matrix() -> Matrix:
+    """`M`, such that `M @ counts` are the timer counts on the next day."""
+    matrix = [[0] * NUM_TIMERS for _ in range(NUM_TIMERS)]
+
+    for timer in range(1, NUM_TIMERS):
+        matrix[timer - 1][timer] = 1
+
+    # Breeding fish start over and each of them adds a new one
+    matrix[FISH_TIMER_AFTER_BREEDING][0] = 1
+    matrix[NEW_FISH_TIMER][0] = 1
+
+    return matrix
+
+
+def multiply_matrices(
+    a: Matrix,
+    b: Matrix,
+    modulus: Optional[int] = None,
+) -> Matrix:
+    columns = list(zip(*b))
+
+    product = [
+        [sum(map(mul, row, column)) for column in columns]
+        for row in a
+    ]
+
+    if modulus is not None:
+        product = [[value % modulus for value in row] for row in product]
+
+    return product
+
+
+def matrix_power(
+    matrix: Matrix,
+    exponent: int,
+    modulus: Optional[int] = None,
+) -> Matrix:
+    """Exponentiation by squaring, `O(log(exponent))` matrix products."""
+    result = [
+        [int(row == column) for column in range(len(matrix))]
+        for row in range(len(matrix))
+    ]
+
+    while exponent > 0:
+        if exponent & 1:
+            result = multiply_matrices(result, matrix, modulus)
+
+        exponent >>= 1
+
+        if exponent > 0:
+            matrix = multiply_matrices(matrix, matrix, modulus)
+
+    return result
+
+
+def apply_matrix_power(
+    matrix: Matrix,
+    exponent: int,
+    vector: List[int],
+    modulus: Optional[int] = None,
+) -> List[int]:
+    """`matrix ** exponent @ vector`, without the full matrix power.
+
+    The powers of a matrix commute, so the squares for the set bits of the
+    exponent can be applied to the vector one by one - matrix-vector products
+    instead of the matrix products of `matrix_power`.
+    """
+    while exponent > 0:
+        if exponent & 1:
+            vector = [sum(map(mul, row, vector)) for row in matrix]
+
+            if modulus is not None:
+                vector = [value % modulus for value in vector]
+
+        exponent >>= 1
+
+        if exponent > 0:
+            matrix = multiply_matrices(matrix, matrix, modulus)
+
+    return vector
+
+
+def simulate_fish_with_matrix_power(
+    data: Data,
+    num_days: int,
+    modulus: Optional[int] = None,
+) -> int:
+    """Counts the fish with the `num_days`-th power of the transition matrix.
+
+    The counts are exact Python ints, which grow by ~0.04 digits per day, so
+    e.g. 10^6 days is still fine, but horizons like 10^12 days need a
+    `modulus` (the result is then the population modulo it).
+    """
+    counts = apply_matrix_power(
+        get_transition_matrix(), num_days, count_timers(data), modulus,
+    )
+
+    population = sum(counts)
+    return population if modulus is None else population % modulus
+
+
+def iter_fish_counts(
+    data: Data,
+    horizons: Iterable[int],
+) -> Iterator[Tuple[int, int]]:
+    """Yields `(horizon, number of fish)`, for non-decreasing horizons.
+
+    All horizons share one pass over the days of the timer buckets, so e.g.
+    every day up to `N` costs `O(N)` in total. The horizons are consumed
+    lazily and the counts are yielded as soon as the pass reaches them.
+    """
+    counts = count_timers(data)
+    population = sum(counts)
+    day = 0
+
+    for horizon in horizons:
+        if horizon < day:
+            raise ValueError(
+                f"Horizons must be non-decreasing, got {horizon} after {day}"
+            )
+
+        # The buckets are rotated implicitly: on day `d`, bucket `d % 9` holds
+        # the fish with timer 0, which become the new fish in the same bucket
+        # and add as many fish restarting with timer 6
+        for day in range(day, horizon):
+            num_breeding = counts[day % NUM_TIMERS]
+            restarted = (day + FISH_TIMER_AFTER_BREEDING + 1) % NUM_TIMERS
+            counts[restarted] += num_breeding
+            population += num_breeding
+
+        day = horizon
+        yield horizon, population
+
+
+def count_fish_at_horizons(data: Data, horizons: Iterable[int]) -> List[int]:
+    """Number of fish after each of the horizons (in any order)."""
+    horizons = list(horizons)
+    fish_counts = dict(iter_fish_counts(data, sorted(set(horizons))))
+
+    return [fish_counts[horizon] for horizon in horizons]
+
+
 def main():
     files = ["example.txt", "input.txt"]
 
@@ -146,23 +310,49 @@ def main():
             assert simulate_fish_with_day_skipping(data, num_days=18) == 26
             assert simulate_fish_with_single_fish_analysis(data, num_days=18) == 26
             assert simulate_fish_using_recursive_function(data, num_days=18) == 26
+            assert simulate_fish_with_matrix_power(data, num_days=18) == 26
 
             assert simulate_fish_naive(data, num_days=80) == 5_934
             assert simulate_fish_with_day_skipping(data, num_days=80) == 5_934
             assert simulate_fish_with_single_fish_analysis(data, num_days=80) == 5_934
             assert simulate_fish_using_recursive_function(data, num_days=80) == 5_934
+            assert simulate_fish_with_matrix_power(data, num_days=80) == 5_934
 
-            # The first three implementations take way too long...
+            # The first three implementations take way too long, see
+            # `python -m aoc.scaling day06` for where each engine gives up
             # assert simulate_fish_naive(data, num_days=256) == 26_984_457_539
             # assert simulate_fish_with_day_skipping(data, num_days=256) == 26_984_457_539
             # assert simulate_fish_with_single_fish_analysis(data, num_days=256) == 26_984_457_539
             assert simulate_fish_using_recursive_function(data, num_days=256) == 26_984_457_539
+            assert simulate_fish_with_matrix_power(data, num_days=256) == 26_984_457_539
+
+            assert simulate_fish_with_matrix_power(
+                data, num_days=256, modulus=1_000_000_007,
+            ) == 26_984_457_539 % 1_000_000_007
+
+            # Starting with one fish per timer, the count is the matrix sum
+            one_fish_per_timer = list(range(NUM_TIMERS))
+            transition_256 = matrix_power(get_transition_matrix(), 256)
+            assert sum(map(sum, transition_256)) == (
+                simulate_fish_with_matrix_power(one_fish_per_timer, 256)
+            )
+
+            assert count_fish_at_horizons(data, [256, 18, 80, 18]) == [
+                26_984_457_539, 26, 5_934, 26,
+            ]
 
         # Part 1
         solution_one = simulate_fish_naive(data, num_days=80)
 
         # Part 2
-        solution_two = simulate_fish_using_recursive_function(data, num_days=256)
+        solution_two = simulate_fish_with_matrix_power(data, num_days=256)
+
+        assert solution_two == simulate_fish_using_recursive_function(data, num_days=256)
+
+        assert list(iter_fish_counts(data, range(0, 257, 32))) == [
+            (num_days, simulate_fish_with_matrix_power(data, num_days))
+            for num_days in range(0, 257, 32)
+        ]
 
         print(
             f"File: {filename}\n"
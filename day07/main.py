@@ -1,9 +1,11 @@
 """Day 7 - Advent of Code"""
 from __future__ import annotations
 
+from bisect import bisect_left
+from itertools import accumulate
 import os
 from statistics import median
-from typing import List
+from typing import Iterable, List
 
 Data = List[int]
 
@@ -43,13 +45,83 @@ def compute_new_fuel_cost(positions: Data, target_position: int) -> int:
     return sum([single_submarine_cost(p) for p in positions])
 
 
-def solve_part_two(data: Data) -> int:
+def solve_part_two_naive(data: Data) -> int:
     return min([
         compute_new_fuel_cost(positions=data, target_position=target_position)
         for target_position in range(min(data), max(data) + 1)
     ])
 
 
+class FuelCostOracle:
+    """Total fuel cost of all crabs for any target, in `O(log n)`.
+
+    The positions are sorted once, with prefix sums of the positions and of
+    their squares. The crabs left of a target then cost `k * t - S[k]`, the
+    ones to its right `(S[n] - S[k]) - (n - k) * t`, where `k` comes from a
+    binary search. For the new cost, `|p - t| (|p - t| + 1) / 2` sums to
+    half of the squared distances (expanded with the sum of squares) plus
+    the linear cost. Nothing depends on the range of the positions.
+    """
+
+    def __init__(self, positions: Iterable[int]):
+        self.positions = sorted(positions)
+        self.prefix_sums = [0, *accumulate(self.positions)]
+        self.sum_of_squares = sum(p * p for p in self.positions)
+
+    def compute_fuel_cost(self, target_position: int) -> int:
+        num_crabs = len(self.positions)
+        num_left = bisect_left(self.positions, target_position)
+
+        sum_left = self.prefix_sums[num_left]
+        sum_right = self.prefix_sums[-1] - sum_left
+
+        return (
+            num_left * target_position - sum_left
+            + sum_right - (num_crabs - num_left) * target_position
+        )
+
+    def compute_new_fuel_cost(self, target_position: int) -> int:
+        num_crabs = len(self.positions)
+        sum_of_squared_distances = (
+            self.sum_of_squares
+            - 2 * target_position * self.prefix_sums[-1]
+            + num_crabs * target_position * target_position
+        )
+
+        return (
+            sum_of_squared_distances + self.compute_fuel_cost(target_position)
+        ) // 2
+
+    def find_best_position(self) -> int:
+        """Any median minimizes the (linear) fuel cost."""
+        return self.positions[len(self.positions) // 2]
+
+    def find_best_new_position(self) -> int:
+        """Position with the minimal new fuel cost.
+
+        The new cost is convex and its derivative `n (t - mean) + (#left -
+        #right) / 2` vanishes within `1/2` of the mean, so the best integer
+        position is one of the at most three integers around that interval.
+        """
+        num_crabs = len(self.positions)
+        total = self.prefix_sums[-1]
+
+        lo = (2 * total - num_crabs) // (2 * num_crabs)
+        hi = -((-2 * total - num_crabs) // (2 * num_crabs))
+
+        return min(range(lo, hi + 1), key=self.compute_new_fuel_cost)
+
+
+def solve_part_one_using_oracle(data: Data) -> int:
+    oracle = FuelCostOracle(data)
+    return oracle.compute_fuel_cost(oracle.find_best_position())
+
+
+def solve_part_two(data: Data) -> int:
+    oracle = FuelCostOracle(data)
+    return oracle.compute_new_fuel_cost(oracle.find_best_new_position())
+
+
 def main():
     files = ["example.txt", "input.txt"]
 
@@ -60,6 +132,8 @@ def main():
         if filename == "example.txt":
             assert solve_part_one_naive(data) == 37
             assert solve_part_one_using_median(data) == 37
+            assert solve_part_one_using_oracle(data) == 37
+            assert solve_part_two_naive(data) == 168
             assert solve_part_two(data) == 168
 
         # Part 1
@@ -68,6 +142,9 @@ def main():
         # Part 2
         solution_two = solve_part_two(data)
 
+        assert solution_one == solve_part_one_using_oracle(data)
+        assert solution_two == solve_part_two_naive(data)
+
         print(
             f"File: {filename}\n"
             f"* Part One: {solution_one}\n"
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, List, NamedTuple, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
 
 DisplayOutput = Tuple[str]
 
@@ -15,25 +15,27 @@ class Entry(NamedTuple):
 Data = List[Entry]
 
 
-def read_data(filename: str) -> Data:
-    data = []
-    with open(filename, "r") as fin:
-        for line in fin.readlines():
-            observed, output = line.strip().split(" | ")
+def iter_data(lines: Iterable[str]) -> Iterator[Entry]:
+    """Parses the entries one by one, e.g., from an open file."""
+    for line in lines:
+        observed, output = line.strip().split(" | ")
 
-            observed = [
-                to_canonical_display_output(obs)
-                for obs in observed.split(" ")
-            ]
+        observed = [
+            to_canonical_display_output(obs)
+            for obs in observed.split(" ")
+        ]
 
-            output = [
-                to_canonical_display_output(out)
-                for out in output.split(" ")
-            ]
+        output = [
+            to_canonical_display_output(out)
+            for out in output.split(" ")
+        ]
 
-            data.append(Entry(observed=observed, output=output))
+        yield Entry(observed=observed, output=output)
 
-        return data
+
+def read_data(filename: str) -> Data:
+    with open(filename, "r") as fin:
+        return list(iter_data(fin))
 
 
 def to_canonical_display_output(out: str) -> DisplayOutput:
@@ -41,7 +43,7 @@ def to_canonical_display_output(out: str) -> DisplayOutput:
     return tuple(sorted_segments)
 
 
-def solve_part_one(data: Data) -> int:
+def solve_part_one(data: Iterable[Entry]) -> int:
     # We need to count how many times the digits 1, 4, 7, 8 occurred in the
     # outputs (i.e., after the "|" character). Those digits are composed of
     # 2, 4, 3 and 7 segments, respectively. So we need to count how many times
@@ -185,7 +187,7 @@ def output_to_digit(output: DisplayOutput, mapping: Dict[str, str]) -> int:
     return SEGMENTS_TO_DIGIT[original_segments]
 
 
-def solve_part_two(data: Data) -> int:
+def solve_part_two(data: Iterable[Entry]) -> int:
     total = 0
 
     for entry in data:
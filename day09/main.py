@@ -1,58 +1,44 @@
 """Day 9 - Advent of Code"""
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import deque
 import os
-from typing import List, Tuple
+import sys
+from typing import List
 
-Data = Tuple[Tuple[int]]
-Position = Tuple[int, int]
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from aoc.grid import Grid  # noqa: E402
 
-def read_data(filename: str) -> Data:
-    data = []
-    with open(filename, "r") as fin:
-        for line in fin.readlines():
-            data.append(tuple(int(height) for height in line.strip()))
-
-        return tuple(data)
-
+Data = Grid
+Position = int  # Flat cell index, see `Grid.index()`
 
-def get_adjacent_indices(
-    x: int,
-    y: int,
-    width: int,
-    height: int,
-) -> List[Position]:
-    indices = []
 
-    if x > 0:
-        indices.append((x - 1, y))  # Left
-
-    if x < width - 1:
-        indices.append((x + 1, y))  # Right
+def read_data(filename: str) -> Data:
+    with open(filename, "r") as fin:
+        return Grid.from_lines(fin)
 
-    if y > 0:
-        indices.append((x, y - 1))  # Up
 
-    if y < height - 1:
-        indices.append((x, y + 1))  # Down
+def find_low_points(data: Data) -> List[Position]:
+    # A border higher than any location removes the bounds checks, so the
+    # neighbors are plain index offsets
+    padded = data.padded(delta=1, value=10)
+    heights = padded.cells
+    width = padded.width
 
-    return indices
+    low_points = []
 
+    for row in range(1, padded.height - 1):
+        for idx in range(row * width + 1, (row + 1) * width - 1):
+            value = heights[idx]
 
-def find_low_points(data: Data) -> List[Position]:
-    low_points = []
-    for i, row in enumerate(data):
-        for j, value in enumerate(row):
-            neighbor_indices = get_adjacent_indices(
-                x=j,
-                y=i,
-                width=len(row),
-                height=len(data),
-            )
-            if all(value < data[y][x] for x, y in neighbor_indices):
-                low_points.append((i, j))
+            if (
+                value < heights[idx - 1]
+                and value < heights[idx + 1]
+                and value < heights[idx - width]
+                and value < heights[idx + width]
+            ):
+                low_points.append((row - 1) * data.width + idx % width - 1)
 
     return low_points
 
@@ -60,35 +46,33 @@ def find_low_points(data: Data) -> List[Position]:
 def solve_part_one(data: Data) -> int:
     total_risk_level = 0
 
-    for i, j in find_low_points(data):
-        risk = data[i][j] + 1
+    for idx in find_low_points(data):
+        risk = data.cells[idx] + 1
         total_risk_level += risk
 
     return total_risk_level
 
 
 def get_basin(low_point: Position, data: Data) -> List[Position]:
-    visited = defaultdict(bool)
-    queue = [low_point]
-
-    while queue:
-        i, j = queue.pop(0)
-        visited[(i, j)] = True
+    heights = data.cells
+    neighbors = data.neighbors4()
 
-        indices = get_adjacent_indices(
-            x=j, y=i, width=len(data[0]), height=len(data),
-        )
+    visited = bytearray(data.size)
+    visited[low_point] = 1
+    queue = deque([low_point])
+    basin_indices = []
 
-        for x, y in indices:
-            if data[y][x] == 9:
-                continue
+    while queue:
+        idx = queue.popleft()
+        basin_indices.append(idx)
 
-            if visited[(y, x)]:
+        for n in neighbors[idx]:
+            if heights[n] == 9 or visited[n]:
                 continue
 
-            queue.append((y, x))
+            visited[n] = 1
+            queue.append(n)
 
-    basin_indices = list(visited.keys())
     return basin_indices
 
 
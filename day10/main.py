@@ -2,18 +2,20 @@
 from __future__ import annotations
 
 import os
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 Data = List[str]
 
 
+def iter_data(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the lines one by one, e.g., from an open file."""
+    for line in lines:
+        yield line.strip()
+
+
 def read_data(filename: str) -> Data:
-    data = []
     with open(filename, "r") as fin:
-        for line in fin.readlines():
-            data.append(line.strip())
-
-        return data
+        return list(iter_data(fin))
 
 
 def matches(opening_character: str, closing_character: str) -> bool:
@@ -38,7 +40,7 @@ def parse(line: str) -> Tuple[List[str], Optional[str]]:
     return stack, None
 
 
-def solve_part_one(data: Data) -> int:
+def solve_part_one(data: Iterable[str]) -> int:
     scores = {")": 3, "]": 57, "}": 1197, ">": 25137, None: 0}
 
     total_syntax_error_score = 0
@@ -67,7 +69,12 @@ def compute_autocomplete_score(missing_characters: List[str]) -> int:
     return total_score
 
 
-def solve_part_two(data: Data) -> int:
+def solve_part_two(data: Iterable[str]) -> int:
+    """Solution for part 2.
+
+    The middle score is only known once all lines are seen, but instead of
+    the lines only a single score per incomplete line is kept.
+    """
     autocomplete_scores = []
 
     for line in data:
@@ -1,97 +1,58 @@
 """Day 11 - Advent of Code"""
 from __future__ import annotations
 
-from copy import deepcopy
 import os
-from typing import List, Tuple
+import sys
+from typing import Tuple
 
-Data = List[List[int]]
-Position = Tuple[int, int]
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from aoc.grid import Grid  # noqa: E402
 
-def read_data(filename: str) -> Data:
-    data = []
-    with open(filename, "r") as fin:
-        for line in fin.readlines():
-            data.append([int(energy_level) for energy_level in line.strip()])
-
-        return data
-
-
-def get_neighbors(row: int, col: int, grid_size: int) -> List[Position]:
-    neighbor_positions = []
-
-    has_space_on_left = col > 0
-    has_space_on_right = col < grid_size - 1
-    has_space_above = row > 0
-    has_space_below = row < grid_size - 1
-
-    # Left
-    if has_space_on_left:
-        neighbor_positions.append((row, col - 1))
-
-    # Right
-    if has_space_on_right:
-        neighbor_positions.append((row, col + 1))
-
-    # Up
-    if has_space_above:
-        neighbor_positions.append((row - 1, col))
+Data = Grid
 
-        if has_space_on_left:
-            neighbor_positions.append((row - 1, col - 1))
 
-        if has_space_on_right:
-            neighbor_positions.append((row - 1, col + 1))
-
-    # Down
-    if has_space_below:
-        neighbor_positions.append((row + 1, col))
-
-        if has_space_on_left:
-            neighbor_positions.append((row + 1, col - 1))
-
-        if has_space_on_right:
-            neighbor_positions.append((row + 1, col + 1))
-
-    return neighbor_positions
+def read_data(filename: str) -> Data:
+    with open(filename, "r") as fin:
+        return Grid.from_lines(fin)
 
 
-def simulate_single_step(
-    energy_levels: Data,
-    grid_size: int = 10,
-) -> Tuple[Data, int]:
-    energy_levels = deepcopy(energy_levels)
+def simulate_single_step(energy_levels: Data) -> Tuple[Data, int]:
+    energy_levels = energy_levels.copy()
+    levels = energy_levels.cells
+    neighbors = energy_levels.neighbors8()
 
     # Increase energy levels
-    for row in range(grid_size):
-        for col in range(grid_size):
-            energy_levels[row][col] += 1
+    to_flash = []
+    for idx in range(energy_levels.size):
+        levels[idx] += 1
 
-    has_flashed = set()
+        if levels[idx] > 9:
+            to_flash.append(idx)
 
-    while True:
-        flash_indices = []
+    has_flashed = bytearray(energy_levels.size)
+    num_flashes = 0
+
+    while to_flash:
+        idx = to_flash.pop()
 
-        for row in range(grid_size):
-            for col in range(grid_size):
-                if energy_levels[row][col] > 9:
-                    flash_indices.append((row, col))
+        if has_flashed[idx]:
+            continue
 
-        if len(flash_indices) == 0:
-            break
+        # Flash
+        levels[idx] = 0
+        has_flashed[idx] = 1
+        num_flashes += 1
 
-        for row, col in flash_indices:
-            # Flash
-            energy_levels[row][col] = 0
-            has_flashed.add((row, col))
+        # Increase neighbor energy levels
+        for n in neighbors[idx]:
+            if not has_flashed[n]:
+                levels[n] += 1
 
-            # Increase neighbor energy levels
-            for nrow, ncol in get_neighbors(row, col, grid_size=grid_size):
-                if (nrow, ncol) not in has_flashed:
-                    energy_levels[nrow][ncol] += 1
+                if levels[n] > 9:
+                    to_flash.append(n)
 
-    return energy_levels, len(has_flashed)
+    return energy_levels, num_flashes
 
 
 def solve_part_one(data: Data) -> int:
@@ -110,25 +71,25 @@ def solve_part_two(data: Data) -> int:
         data, num_flashes = simulate_single_step(data)
         step += 1
 
-        if num_flashes == 100:
+        if num_flashes == data.size:
             return step
 
 
 def run_tests():
-    assert simulate_single_step(energy_levels=[
+    assert simulate_single_step(energy_levels=Grid.from_rows([
         [1, 1, 1, 1, 1],
         [1, 9, 9, 9, 1],
         [1, 9, 1, 9, 1],
         [1, 9, 9, 9, 1],
         [1, 1, 1, 1, 1],
-    ], grid_size=5) == (
-        [
+    ])) == (
+        Grid.from_rows([
             [3, 4, 5, 4, 3],
             [4, 0, 0, 0, 4],
             [5, 0, 0, 0, 5],
             [4, 0, 0, 0, 4],
             [3, 4, 5, 4, 3],
-        ],
+        ]),
         9
     )
     print("Mini-example test passed...")
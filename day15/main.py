@@ -1,51 +1,22 @@
 """Day 15 - Advent of Code"""
 from __future__ import annotations
 
-from copy import deepcopy
 import heapq
 import os
 import sys
-from typing import Dict, List, Tuple
+from typing import List, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-Position = Tuple[int, int]
-Adj = Dict[Position, List[Position]]
-Weights = Dict[Position, int]
-Data = List[List[int]]
+from aoc.grid import Grid  # noqa: E402
+
+Position = int  # Flat cell index, see `Grid.index()`
+Data = Grid
 
 
 def read_data(filename: str) -> Data:
     with open(filename, "r") as fin:
-        return [
-            [int(risk_level) for risk_level in line.strip()]
-            for line in fin.readlines()
-        ]
-
-
-def to_adj(data: Data) -> Tuple[Adj, Weights]:
-    adj = {}
-    weights = {}
-    for x in range(len(data)):
-        for y in range(len(data)):
-            adj[(x, y)] = neighbors((x, y), size=len(data) - 1)
-            weights[(x, y)] = data[x][y]
-
-    return adj, weights
-
-
-def neighbors(pos: Tuple[int, int], size: int) -> List[Tuple[int, int]]:
-    n = [
-        (pos[0], pos[1] - 1),
-        (pos[0], pos[1] + 1),
-        (pos[0] - 1, pos[1]),
-        (pos[0] + 1, pos[1]),
-    ]
-
-    return [
-        (x, y)
-        for (x, y) in n
-        if 0 <= x <= size and 0 <= y <= size
-    ]
+        return Grid.from_lines(fin)
 
 
 class NodePriorityQueue:
@@ -64,18 +35,16 @@ class NodePriorityQueue:
 
 
 def dijkstra(
-    adj: Adj,
-    weights: Weights,
+    grid: Grid,
     start_pos: Position,
     target_pos: Position,
-) -> Dict[Position, int]:
+) -> List[int]:
     """Based on `https://bradfieldcs.com/algos/graphs/dijkstras-algorithm/`"""
-    Q = NodePriorityQueue()
-
-    dist = {}
+    weights = grid.cells
+    neighbors = grid.neighbors4()
 
-    for v in adj.keys():
-        dist[v] = sys.maxsize
+    Q = NodePriorityQueue()
+    dist = [sys.maxsize] * grid.size
 
     dist[start_pos] = 0
     Q.add(node=start_pos, weight=0)
@@ -89,8 +58,9 @@ def dijkstra(
         if u == target_pos:
             break
 
-        for v in adj[u]:
+        for v in neighbors[u]:
             alt = dist_u + weights[v]
+
             if alt < dist[v]:
                 dist[v] = alt
                 Q.add(node=v, weight=alt)
@@ -99,63 +69,45 @@ def dijkstra(
 
 
 def solve_part_one(data: Data) -> int:
-    target_position = (len(data) - 1, len(data) - 1)
+    target_position = data.size - 1
 
-    adj, weights = to_adj(data)
-    dist = dijkstra(
-        adj=adj,
-        weights=weights,
-        start_pos=(0, 0),
-        target_pos=target_position,
-    )
+    dist = dijkstra(grid=data, start_pos=0, target_pos=target_position)
 
     return dist[target_position]
 
 
 def extend_tile_grid(data: Data, final_size: int = 5) -> Data:
-    data = deepcopy(data)
-
-    # Extend to the right
-    for row in data:
-        row.extend([
-            value
-            for delta in range(1, final_size)
-            for value in increment_row_values(row, delta)
-        ])
-
-    # Extend below
-    below_rows = []
-
-    for delta in range(1, final_size):
-        for row in data:
-            below_rows.append(increment_row_values(row, delta))
-
-    data.extend(below_rows)
-
-    return data
-
-
-def increment_row_values(row: List[int], delta: int) -> List[int]:
-    def _increment(value: int) -> int:
-        new_value = value + delta
-
-        if new_value > 9:
-            new_value -= 9
+    # Translation tables incrementing all risk levels by `delta`, where the
+    # levels above 9 wrap around back to 1
+    increment = [
+        bytes.maketrans(
+            bytes(range(1, 10)),
+            bytes((value + delta - 1) % 9 + 1 for value in range(1, 10)),
+        )
+        for delta in range(2 * final_size - 1)
+    ]
 
-        return new_value
+    cells = bytearray()
+    for tile_row in range(final_size):
+        for row in data.rows():
+            for tile_col in range(final_size):
+                cells += row.translate(increment[tile_row + tile_col])
 
-    return [_increment(v) for v in row]
+    return Grid(
+        width=data.width * final_size,
+        height=data.height * final_size,
+        cells=cells,
+    )
 
 
 def solve_part_two(data: Data) -> int:
     extended_grid = extend_tile_grid(data=data)
-    target_position = (len(extended_grid) - 1, len(extended_grid) - 1)
 
-    adj, weights = to_adj(data=extended_grid)
+    target_position = extended_grid.size - 1
+
     dist = dijkstra(
-        adj=adj,
-        weights=weights,
-        start_pos=(0, 0),
+        grid=extended_grid,
+        start_pos=0,
         target_pos=target_position,
     )
 
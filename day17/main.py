@@ -13,6 +13,12 @@ class Data(NamedTuple):
     y_max: int
 
 
+CASES = {
+    "example": Data(x_min=20, x_max=30, y_min=-10, y_max=-5),
+    "input": Data(x_min=94, x_max=151, y_min=-156, y_max=-103),
+}
+
+
 def will_hit_target(v_x: int, v_y: int, target: Data) -> bool:
     x, y = (0, 0)
 
@@ -90,12 +96,7 @@ def solve(data: Data) -> Tuple[int, int]:
 
 
 def main():
-    cases = [
-        ("example", Data(x_min=20, x_max=30, y_min=-10, y_max=-5)),
-        ("input", Data(x_min=94, x_max=151, y_min=-156, y_max=-103)),
-    ]
-
-    for name, data in cases:
+    for name, data in CASES.items():
         y_max, num_hits = solve(data)
 
         if name == "example":
@@ -2,91 +2,86 @@
 from __future__ import annotations
 
 import os
-from typing import List, NamedTuple, Tuple
+import sys
+from typing import NamedTuple
 
-Image = List[str]
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import Grid, make_translation_table  # noqa: E402
+
+PIXELS = {".": 0, "#": 1}
+PIXEL_TABLE, _ = make_translation_table(PIXELS)
 
 
 class Data(NamedTuple):
-    enhancement_lookup: str
-    image: Image
+    enhancement_lookup: bytes
+    image: Grid
 
 
 def read_data(filename: str) -> Data:
     with open(filename, "r") as fin:
         enhancement_lookup, image = fin.read().split("\n\n")
-        image = image.split("\n")
-
-        return Data(enhancement_lookup=enhancement_lookup, image=image)
-
-
-def add_background(image: Image, background: str, delta: int = 3) -> Image:
-    width = len(image[0])
-
-    enlarged = []
-
-    for _ in range(delta):
-        enlarged.append(background * (width + 2 * delta))
 
-    for line in image:
-        enlarged.append((background * delta) + line + (background * delta))
-
-    for _ in range(delta):
-        enlarged.append(background * (width + 2 * delta))
-
-    return enlarged
+        return Data(
+            enhancement_lookup=(
+                enhancement_lookup.encode().translate(PIXEL_TABLE)
+            ),
+            image=Grid.from_lines(image.split("\n"), mapping=PIXELS),
+        )
 
 
-def get_neighbor_indices(row: int, col: int) -> List[Tuple[int, int]]:
-    return [
-        # Top row
-        (row - 1, col - 1), (row - 1, col), (row - 1, col + 1),
-        # Middle row
-        (row, col - 1), (row, col), (row, col + 1),
-        # Bottom row
-        (row + 1, col - 1), (row + 1, col), (row + 1, col + 1),
-    ]
+def enhance_image(image: Grid, enhancement_lookup: bytes) -> Grid:
+    """Enhances all pixels except for the outermost ones.
 
+    The 9-bit lookup index is built from the 3x3 window around the pixel. When
+    the window slides one column to the right, each of its three rows drops
+    its leftmost bit (the mask) and takes a new bit on the right.
+    """
+    width = image.width
+    pixels = image.cells
 
-def enhance_image(image: Image, enhancement_lookup: str) -> List[str]:
-    enhanced = []
-    for row in range(1, len(image) - 1):
-        line = []
+    enhanced = bytearray()
 
-        for col in range(1, len(image[0]) - 1):
-            pixels = [image[r][c] for r, c in get_neighbor_indices(row, col)]
-            pixels = ''.join(pixels)
-            idx = int(pixels.replace(".", "0").replace("#", "1"), 2)
+    for row in range(1, image.height - 1):
+        top = (row - 1) * width
+        middle = row * width
+        bottom = (row + 1) * width
 
-            line.append(enhancement_lookup[idx])
+        idx = (
+            (pixels[top] << 7) | (pixels[top + 1] << 6)
+            | (pixels[middle] << 4) | (pixels[middle + 1] << 3)
+            | (pixels[bottom] << 1) | pixels[bottom + 1]
+        )
 
-        enhanced.append(''.join(line))
+        for col in range(2, width):
+            idx = (
+                ((idx << 1) & 0b110_110_110)
+                | (pixels[top + col] << 6)
+                | (pixels[middle + col] << 3)
+                | pixels[bottom + col]
+            )
+            enhanced.append(enhancement_lookup[idx])
 
-    return enhanced
+    return Grid(width=width - 2, height=image.height - 2, cells=enhanced)
 
 
-def compute_new_background(current_background: str, lookup: str) -> str:
-    idx = int(current_background.replace(".", "0").replace("#", "1") * 9, 2)
+def compute_new_background(current_background: int, lookup: bytes) -> int:
+    idx = 0b111_111_111 if current_background else 0
     return lookup[idx]
 
 
 def enhance_for(data: Data, num_steps: int) -> int:
     lookup = data.enhancement_lookup
 
-    background = "."
+    background = 0
     image = data.image
 
     for _ in range(num_steps):
-        image = add_background(image, background, delta=2)
+        image = image.padded(delta=2, value=background)
         image = enhance_image(image, lookup)
         background = compute_new_background(background, lookup)
 
-    num_lit_pixels = 0
-
-    for line in image:
-        num_lit_pixels += line.count("#")
-
-    return num_lit_pixels
+    return image.count(1)
 
 
 def solve_part_one(data: Data) -> int:
@@ -1,10 +1,14 @@
 """Day 21 - Advent of Code"""
 from __future__ import annotations
 
-from functools import lru_cache
 import os
+import sys
 from typing import Generator, NamedTuple, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.memo import memoize  # noqa: E402
+
 
 class Data(NamedTuple):
     player_1_starting_position: int
@@ -65,7 +69,7 @@ def solve_part_one(data: Data) -> int:
     return answer
 
 
-@lru_cache(maxsize=None)
+@memoize
 def count_wins_with_universe_split(
     p1_score: int, p1_pos: int,
     p2_score: int, p2_pos: int,
@@ -115,11 +119,12 @@ def count_wins_with_universe_split(
             _p1_score = p1_score
             _p1_pos = p1_pos
 
+        # Positional arguments make cheaper cache keys than keyword ones
         p1w, p2w = count_wins_with_universe_split(
-            p1_score=_p1_score, p1_pos=_p1_pos,
-            p2_score=_p2_score, p2_pos=_p2_pos,
-            turn="p1" if turn == "p2" else "p2",
-            p1_wins=p1_wins, p2_wins=p2_wins,
+            _p1_score, _p1_pos,
+            _p2_score, _p2_pos,
+            "p1" if turn == "p2" else "p2",
+            p1_wins, p2_wins,
         )
         _p1_wins += p1w * count
         _p2_wins += p2w * count
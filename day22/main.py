@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import os
-from typing import Generator, List, NamedTuple, Set, Tuple
+from typing import Generator, Iterable, Iterator, List, NamedTuple, Set, Tuple
 
 
 Position = Tuple[int, int, int]
@@ -76,21 +76,23 @@ class RebootStep(NamedTuple):
 Data = List[RebootStep]
 
 
-def read_data(filename: str) -> Data:
-    with open(filename, "r") as fin:
-        steps = []
-        for idx, line in enumerate(fin.readlines()):
-            mode, coordinate_ranges = line.strip().split(" ")
+def iter_data(lines: Iterable[str]) -> Iterator[RebootStep]:
+    """Parses the reboot steps one by one, e.g., from an open file."""
+    for line in lines:
+        mode, coordinate_ranges = line.strip().split(" ")
+
+        xrange, yrange, zrange = coordinate_ranges.split(",")
 
-            xrange, yrange, zrange = coordinate_ranges.split(",")
+        xrange = Range.from_str(xrange)
+        yrange = Range.from_str(yrange)
+        zrange = Range.from_str(zrange)
 
-            xrange = Range.from_str(xrange)
-            yrange = Range.from_str(yrange)
-            zrange = Range.from_str(zrange)
+        yield RebootStep(mode, Cuboid(xrange, yrange, zrange))
 
-            steps.append(RebootStep(mode, Cuboid(xrange, yrange, zrange)))
 
-        return steps
+def read_data(filename: str) -> Data:
+    with open(filename, "r") as fin:
+        return list(iter_data(fin))
 
 
 def is_in_region(
@@ -117,7 +119,12 @@ def is_in_region(
     return valid_xrange and valid_yrange and valid_zrange
 
 
-def count_active(reboot_steps: Data) -> int:
+def count_active(reboot_steps: Iterable[RebootStep]) -> int:
+    """Inclusion-exclusion over the signed intersections of the cuboids.
+
+    The steps are consumed one by one, but the signed cuboids (the state of
+    the reactor) are retained, as every step has to be intersected with them.
+    """
     cuboids = []
 
     for reboot_step in reboot_steps:
@@ -145,15 +152,15 @@ def count_active(reboot_steps: Data) -> int:
     return num_active
 
 
-def solve_part_one(data: Data) -> int:
-    return count_active(reboot_steps=[
+def solve_part_one(data: Iterable[RebootStep]) -> int:
+    return count_active(reboot_steps=(
         step
         for step in data
         if is_in_region(step)
-    ])
+    ))
 
 
-def solve_part_two(data: Data) -> int:
+def solve_part_two(data: Iterable[RebootStep]) -> int:
     return count_active(reboot_steps=data)
 
 
@@ -1,10 +1,14 @@
 """Day 23 - Advent of Code"""
 from __future__ import annotations
 
-from functools import lru_cache
+import os
 import sys
 from typing import List, NamedTuple, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.memo import memoize  # noqa: E402
+
 ENERGY_PER_STEP_2 = {"A": 1, "B": 10, "C": 100, "D": 1000}
 
 ROOM_ENTRANCES = {"R1": 3, "R2": 5, "R3": 7, "R4": 9}
@@ -268,7 +272,7 @@ def matches_room(amphipod_type: str, room_type: str) -> bool:
     return room_type == "R4"
 
 
-@lru_cache(maxsize=None)
+@memoize
 def get_min_moving_cost(state: State) -> Tuple[int, Tuple[str, ...]]:
     if state.is_done():
         return 0, ()
@@ -282,9 +286,8 @@ def get_min_moving_cost(state: State) -> Tuple[int, Tuple[str, ...]]:
         return sys.maxsize, ()
 
     for move in valid_moves:
-        new_cost, new_actions = get_min_moving_cost(
-            state=state.apply_move(move),
-        )
+        # A positional argument makes a cheaper cache key than a keyword one
+        new_cost, new_actions = get_min_moving_cost(state.apply_move(move))
         move_cost = move[2]
 
         if new_cost + move_cost < best_cost:
@@ -1,89 +1,51 @@
 """Day 25 - Advent of Code"""
 from __future__ import annotations
 
-from copy import deepcopy
 import os
-from typing import List, Tuple
+import sys
+from typing import List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-class SeaFloor:
+from aoc.grid import Grid  # noqa: E402
 
-    def __init__(self, fields: List[List[str]]):
-        self.fields = fields
-        self.width = len(fields[0])
-        self.height = len(fields)
+EMPTY = 0
+EAST = 1
+SOUTH = 2
 
-    def copy(self) -> SeaFloor:
-        return deepcopy(self)
+FIELDS = {".": EMPTY, ">": EAST, "v": SOUTH}
 
-    def __eq__(self, other: SeaFloor) -> bool:
-        return all(
-            sline == oline
-            for sline, oline
-            in zip(self.fields, other.fields)
-        )
-
-    def __getitem__(self, idx: Tuple[int, int]) -> str:
-        row, col = idx
-
-        return self.fields[row][col]
-
-    def __setitem__(self, key: Tuple[int, int], value: str):
-        row, col = key
-        self.fields[row][col] = value
-
-    def __repr__(self):
-        return "\n".join("".join(line) for line in self.fields)
+# The sea cucumbers that leave one edge of the map reappear on the other one
+SeaFloor = Grid
 
 
 def read_data(filename: str) -> SeaFloor:
     with open(filename, "r") as fin:
-        fields = [list(line.strip()) for line in fin.readlines()]
-        return SeaFloor(fields)
+        return Grid.from_lines(fin, mapping=FIELDS, wrap=True)
 
 
-def update(seafloor: SeaFloor) -> SeaFloor:
+def move_herd(
+    seafloor: SeaFloor,
+    herd: int,
+    targets: List[int],
+) -> SeaFloor:
     out = seafloor.copy()
+    fields = seafloor.cells
 
-    east_facing_positions = [
-        (row, col)
-        for row in range(out.height)
-        for col in range(out.width)
-        if out[row, col] == ">"
-    ]
-
-    south_facing_positions = [
-        (row, col)
-        for row in range(out.height)
-        for col in range(out.width)
-        if out[row, col] == "v"
-    ]
+    for idx, field in enumerate(fields):
+        if field == herd and fields[targets[idx]] == EMPTY:
+            out.cells[idx] = EMPTY
+            out.cells[targets[idx]] = herd
 
-    # Update east facing ones
-    east_updates = []
-    for row, col in east_facing_positions:
-        current_pos = row, col
-        target_pos = row, (col + 1) % out.width
+    return out
 
-        if out[target_pos] == ".":
-            east_updates.append((current_pos, target_pos))
 
-    for cpos, tpos in east_updates:
-        out[cpos] = "."
-        out[tpos] = ">"
+def update(seafloor: SeaFloor) -> SeaFloor:
+    # Update east facing ones
+    out = move_herd(seafloor, EAST, targets=seafloor.offset_table(0, 1))
 
     # Update south facing ones
-    south_updates = []
-    for row, col in south_facing_positions:
-        current_pos = row, col
-        target_pos = (row + 1) % out.height, col
-
-        if out[target_pos] == ".":
-            south_updates.append((current_pos, target_pos))
-
-    for cpos, tpos in south_updates:
-        out[cpos] = "."
-        out[tpos] = "v"
+    out = move_herd(out, SOUTH, targets=seafloor.offset_table(1, 0))
 
     return out
 